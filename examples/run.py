@@ -76,43 +76,29 @@ async def test_async():
     print("ASYNC CLIENT TEST")
     print("=" * 50)
     
-    client = async_inference(api_key=API_KEY, base_url="https://api-dev.inference.sh")
-    
-    # Test 1: Run and wait (default)
-    print("\n1. await run() - wait for completion (default)")
-    task = await client.run(TASK_PARAMS)    
-    print(f"   Task ID: {task['id']}")
-    print(f"   Status: {TaskStatus(task['status']).name}")
-    if task["status"] == TaskStatus.COMPLETED:
-        print(f"   Output: {task['output']}")
-    
-    # Test 2: Run with wait=False
-    print("\n2. await run(wait=False) - return immediately")
-    task = await client.run(TASK_PARAMS, wait=False)
-    print(f"   Task ID: {task['id']}")
-    print(f"   Status: {TaskStatus(task['status']).name}")
-    
-    # Test 3: get_task
-    print(f"\n3. await get_task('{task['id']}')")
-    task_info = await client.get_task(task["id"])
-    print(f"   Status: {TaskStatus(task_info['status']).name}")
-    
-    # Test 4: Stream updates
-    print("\n4. async for in await run(stream=True)")
-    async for update in await client.run(TASK_PARAMS, stream=True):
-        status = update.get('status')
-        if status is not None:
-            status_name = TaskStatus(status).name
-            print(f"   Status: {status_name}")
-            if status == TaskStatus.COMPLETED:
-                print(f"   Output: {update.get('output')}")
-                break
-    
-    # Test 5: stream_task
-    print("\n5. async with stream_task()")
-    task = await client.run(TASK_PARAMS, wait=False)
-    async with client.stream_task(task["id"]) as stream:
-        async for update in stream:
+    async with async_inference(api_key=API_KEY, base_url="https://api-dev.inference.sh") as client:
+        # Test 1: Run and wait (default)
+        print("\n1. await run() - wait for completion (default)")
+        task = await client.run(TASK_PARAMS)    
+        print(f"   Task ID: {task['id']}")
+        print(f"   Status: {TaskStatus(task['status']).name}")
+        if task["status"] == TaskStatus.COMPLETED:
+            print(f"   Output: {task['output']}")
+    
+        # Test 2: Run with wait=False
+        print("\n2. await run(wait=False) - return immediately")
+        task = await client.run(TASK_PARAMS, wait=False)
+        print(f"   Task ID: {task['id']}")
+        print(f"   Status: {TaskStatus(task['status']).name}")
+    
+        # Test 3: get_task
+        print(f"\n3. await get_task('{task['id']}')")
+        task_info = await client.get_task(task["id"])
+        print(f"   Status: {TaskStatus(task_info['status']).name}")
+    
+        # Test 4: Stream updates
+        print("\n4. async for in await run(stream=True)")
+        async for update in await client.run(TASK_PARAMS, stream=True):
             status = update.get('status')
             if status is not None:
                 status_name = TaskStatus(status).name
@@ -121,6 +107,19 @@ async def test_async():
                     print(f"   Output: {update.get('output')}")
                     break
     
+        # Test 5: stream_task
+        print("\n5. async with stream_task()")
+        task = await client.run(TASK_PARAMS, wait=False)
+        async with client.stream_task(task["id"]) as stream:
+            async for update in stream:
+                status = update.get('status')
+                if status is not None:
+                    status_name = TaskStatus(status).name
+                    print(f"   Status: {status_name}")
+                    if status == TaskStatus.COMPLETED:
+                        print(f"   Output: {update.get('output')}")
+                        break
+    
     print("\n✓ Async client tests passed!")
 
 
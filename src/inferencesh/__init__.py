@@ -125,15 +125,23 @@ def inference(*, api_key: str, base_url: str | None = None) -> Inference:
     return Inference(api_key=api_key, base_url=base_url)
 
 
-def async_inference(*, api_key: str, base_url: str | None = None) -> AsyncInference:
+def async_inference(
+    *,
+    api_key: str,
+    base_url: str | None = None,
+    max_concurrent_calls: int | None = 64,
+) -> AsyncInference:
     """Factory function for creating an AsyncInference client (lowercase for branding).
-    
+
+    ``max_concurrent_calls`` bounds the client's in-flight API requests,
+    priority session calls included (``None`` for no bound).
+
     Example:
         ```python
         client = async_inference(api_key="your-api-key")
         ```
     """
-    return AsyncInference(api_key=api_key, base_url=base_url)
+    return AsyncInference(api_key=api_key, base_url=base_url, max_concurrent_calls=max_concurrent_calls)
 
 __all__ = [
     # Base types
@@ -31,13 +31,14 @@ class FilesAPI:
 
     def upload(
         self,
-        data: Union[str, bytes],
+        data: Union[str, bytes, bytearray, memoryview],
         options: Optional["UploadFileOptions"] = None,
     ) -> Dict[str, Any]:
         """Upload a file.
 
         Args:
-            data: File content as bytes, base64 string, data URI, or file path
+            data: File content as bytes (or a bytearray/memoryview, sent without
+                copying), base64 string, data URI, or file path
             options: Upload options (filename, content_type, path, public)
 
         Returns:
@@ -63,7 +64,7 @@ class AsyncFilesAPI:
 
     async def upload(
         self,
-        data: Union[str, bytes],
+        data: Union[str, bytes, bytearray, memoryview],
         options: Optional["UploadFileOptions"] = None,
     ) -> Dict[str, Any]:
         """Upload a file.
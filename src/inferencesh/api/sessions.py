@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar, TYPE_CHECKING
 
 from ..types import AppSession
 
 if TYPE_CHECKING:
     from ..client import Inference, AsyncInference
 
+T = TypeVar("T")
+
+# Default number of per-session requests in flight for the *_many helpers
+_MANY_CONCURRENCY = 16
+
 
 class SessionHandle:
     """Handle for interacting with an active session.
@@ -26,6 +34,7 @@ class SessionHandle:
         self._app = app
         self._session_id = session_id
         self._ended = False
+        self._end_lock = threading.Lock()
 
     @property
     def session_id(self) -> str:
@@ -70,10 +79,20 @@ class SessionHandle:
         return self._client.sessions.keepalive(self._session_id)
 
     def end(self) -> None:
-        """End this session."""
-        if not self._ended:
-            self._client.sessions.end(self._session_id)
+        """End this session.
+
+        Safe to call concurrently (e.g. from another thread while ``__exit__``
+        runs): only the first caller issues the DELETE.
+        """
+        with self._end_lock:
+            if self._ended:
+                return
             self._ended = True
+        try:
+            self._client.sessions.end(self._session_id)
+        except BaseException:
+            self._ended = False
+            raise
 
     def __enter__(self) -> "SessionHandle":
         return self
@@ -108,6 +127,8 @@ class AsyncSessionHandle:
         self,
         function: str = "run",
         input: Optional[Dict[str, Any]] = None,
+        *,
+        priority: bool = False,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """Make a call within this session.
@@ -115,6 +136,9 @@ class AsyncSessionHandle:
         Args:
             function: Function name to call (default: "run")
             input: Input data for the function
+            priority: Use the slots the client reserves out of
+                ``max_concurrent_calls`` for priority calls, instead of queueing
+                behind regular calls when those are all busy
             **kwargs: Additional parameters for run()
 
         Returns:
@@ -123,15 +147,21 @@ class AsyncSessionHandle:
         if self._ended:
             raise RuntimeError("Session has been ended")
 
-        return await self._client.run(
-            {
-                "app": self._app,
-                "function": function,
-                "input": input or {},
-                "session": self._session_id,
-            },
-            **kwargs,
-        )
+        from ..client import _PRIORITY_CALL
+
+        token = _PRIORITY_CALL.set(priority)
+        try:
+            return await self._client.run(
+                {
+                    "app": self._app,
+                    "function": function,
+                    "input": input or {},
+                    "session": self._session_id,
+                },
+                **kwargs,
+            )
+        finally:
+            _PRIORITY_CALL.reset(token)
 
     async def info(self) -> AppSession:
         """Get current session info."""
@@ -142,10 +172,19 @@ class AsyncSessionHandle:
         return await self._client.sessions.keepalive(self._session_id)
 
     async def end(self) -> None:
-        """End this session."""
-        if not self._ended:
+        """End this session.
+
+        The handle is marked ended before the DELETE is awaited, so a
+        concurrent ``end()``/``__aexit__`` on the same loop returns immediately.
+        """
+        if self._ended:
+            return
+        self._ended = True
+        try:
             await self._client.sessions.end(self._session_id)
-            self._ended = True
+        except BaseException:
+            self._ended = False
+            raise
 
     async def __aenter__(self) -> "AsyncSessionHandle":
         return self
@@ -171,6 +210,9 @@ class SessionsAPI:
         # Keep session alive
         client.sessions.keepalive("sess_abc123")
 
+        # Keep several sessions alive concurrently
+        client.sessions.keepalive_many(["sess_abc123", "sess_def456"])
+
         # End session
         client.sessions.end("sess_abc123")
         ```
@@ -231,6 +273,49 @@ class SessionsAPI:
         """
         self._client._request("delete", f"/sessions/{session_id}")
 
+    def get_many(self, session_ids: List[str], max_workers: int = _MANY_CONCURRENCY) -> List[AppSession]:
+        """Get information about several sessions concurrently.
+
+        Args:
+            session_ids: The session IDs
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            Session information, in the same order as ``session_ids``
+        """
+        return self._map(self.get, session_ids, max_workers)
+
+    def keepalive_many(self, session_ids: List[str], max_workers: int = _MANY_CONCURRENCY) -> List[AppSession]:
+        """Extend expiration time for several sessions concurrently.
+
+        Args:
+            session_ids: The session IDs
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            Updated session information, in the same order as ``session_ids``
+        """
+        return self._map(self.keepalive, session_ids, max_workers)
+
+    def end_many(self, session_ids: List[str], max_workers: int = _MANY_CONCURRENCY) -> None:
+        """End several sessions concurrently.
+
+        Args:
+            session_ids: The session IDs
+            max_workers: Maximum number of requests in flight
+        """
+        self._map(self.end, session_ids, max_workers)
+
+    @staticmethod
+    def _map(fn: Callable[[str], T], session_ids: List[str], max_workers: int) -> List[T]:
+        # Repeated IDs share one request (and are never ended twice)
+        unique = list(dict.fromkeys(session_ids))
+        if not unique:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as ex:
+            results = dict(zip(unique, ex.map(fn, unique)))
+        return [results[i] for i in session_ids]
+
 
 class AsyncSessionsAPI:
     """Asynchronous Sessions API.
@@ -248,6 +333,9 @@ class AsyncSessionsAPI:
         # Keep session alive
         await client.sessions.keepalive("sess_abc123")
 
+        # Keep several sessions alive concurrently
+        await client.sessions.keepalive_many(["sess_abc123", "sess_def456"])
+
         # End session
         await client.sessions.end("sess_abc123")
         ```
@@ -274,3 +362,28 @@ class AsyncSessionsAPI:
     async def end(self, session_id: str) -> None:
         """End a session and release the worker."""
         await self._client._request("delete", f"/sessions/{session_id}")
+
+    async def get_many(self, session_ids: List[str], limit: int = _MANY_CONCURRENCY) -> List[AppSession]:
+        """Get information about several sessions concurrently, in input order."""
+        return await self._gather(self.get, session_ids, limit)
+
+    async def keepalive_many(self, session_ids: List[str], limit: int = _MANY_CONCURRENCY) -> List[AppSession]:
+        """Extend expiration time for several sessions concurrently, in input order."""
+        return await self._gather(self.keepalive, session_ids, limit)
+
+    async def end_many(self, session_ids: List[str], limit: int = _MANY_CONCURRENCY) -> None:
+        """End several sessions concurrently."""
+        await self._gather(self.end, session_ids, limit)
+
+    @staticmethod
+    async def _gather(fn: Callable[[str], Awaitable[T]], session_ids: List[str], limit: int) -> List[T]:
+        sem = asyncio.Semaphore(limit)
+
+        async def _one(session_id: str) -> T:
+            async with sem:
+                return await fn(session_id)
+
+        # Repeated IDs share one request (and are never ended twice)
+        unique = list(dict.fromkeys(session_ids))
+        results = dict(zip(unique, await asyncio.gather(*(_one(i) for i in unique))))
+        return [results[i] for i in session_ids]
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional, Callable, Generator, Union, Iterator, AsyncIterator, TYPE_CHECKING
 from dataclasses import dataclass
+import contextlib
+import contextvars
 import json
 import re
 import time
@@ -10,11 +12,24 @@ import os
 from contextlib import AbstractContextManager, AbstractAsyncContextManager
 from typing import Protocol, runtime_checkable
 
+try:  # optional: much faster JSON encode/decode (pip install inferencesh[fast])
+    import orjson as _orjson
+except ImportError:
+    _orjson = None  # type: ignore[assignment]
+
 from .models.errors import APIError, RequirementsNotMetError
 from .types import TaskStatus, ChatMessageStatus
 
+# Set while running a priority call (see AsyncSessionHandle.call); such requests
+# draw from AsyncInference's reserved priority slots instead of the shared pool.
+_PRIORITY_CALL: contextvars.ContextVar[bool] = contextvars.ContextVar("inferencesh_priority_call", default=False)
+
 # Terminal statuses where a task is considered "done"
-TERMINAL_STATUSES = {TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED}
+TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
+
+# Map int status values to TaskStatus members. A dict hit is several times
+# cheaper than TaskStatus(value), which goes through EnumMeta.__call__.
+_STATUS_INT_MAP = {member.value: member for member in TaskStatus}
 
 # Map string status names to TaskStatus enum (for future string-based API)
 _STATUS_STRING_MAP = {
@@ -34,6 +49,29 @@ _STATUS_STRING_MAP = {
 }
 
 
+def _json_dumps(obj: Any) -> Union[str, bytes]:
+    """Encode a request body, with orjson when it is installed."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj)
+        except TypeError:
+            # e.g. non-str dict keys or ints beyond 64 bits; stdlib handles those
+            pass
+    return json.dumps(obj)
+
+
+def _json_dumps_text(obj: Any) -> str:
+    out = _json_dumps(obj)
+    return out.decode() if isinstance(out, bytes) else out
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Decode a response body; orjson errors subclass json.JSONDecodeError."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
 def parse_status(status: Union[int, str, None]) -> Optional[TaskStatus]:
     """Parse task status from int or string to TaskStatus enum.
 
@@ -42,10 +80,7 @@ def parse_status(status: Union[int, str, None]) -> Optional[TaskStatus]:
     if status is None:
         return None
     if isinstance(status, int):
-        try:
-            return TaskStatus(status)
-        except ValueError:
-            return TaskStatus.UNKNOWN
+        return _STATUS_INT_MAP.get(status, TaskStatus.UNKNOWN)
     if isinstance(status, str):
         return _STATUS_STRING_MAP.get(status.lower(), TaskStatus.UNKNOWN)
     return TaskStatus.UNKNOWN
@@ -541,7 +576,7 @@ class Inference:
             method=method.upper(),
             url=url,
             params=params,
-            data=json.dumps(data) if data is not None else None,
+            data=_json_dumps(data) if data is not None else None,
             headers=merged_headers,
             stream=stream,
             timeout=timeout or 30,
@@ -555,7 +590,7 @@ class Inference:
         # Try to parse as JSON
         payload = None
         try:
-            payload = json.loads(response_text) if response_text else None
+            payload = _json_loads(response_text) if response_text else None
         except Exception:
             pass
         
@@ -726,12 +761,15 @@ class Inference:
         raise RuntimeError("Stream ended without completion")
 
     # --------------- File upload ---------------
-    def upload_file(self, data: Union[str, bytes], options: Optional[UploadFileOptions] = None) -> Dict[str, Any]:
+    def upload_file(self, data: Union[str, bytes, bytearray, memoryview], options: Optional[UploadFileOptions] = None) -> Dict[str, Any]:
         options = options or UploadFileOptions()
         content_type = options.content_type
-        raw_bytes: bytes
-        if isinstance(data, bytes):
-            raw_bytes = data
+        raw_bytes: Union[bytes, memoryview] = b""
+        # Local files are streamed from disk on upload rather than read into memory
+        upload_path: Optional[str] = None
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            # Other buffers go out through a flat byte view, never copied to bytes
+            raw_bytes = data if isinstance(data, bytes) else memoryview(data).cast("B")
             if not content_type:
                 content_type = "application/octet-stream"
         else:
@@ -740,8 +778,7 @@ class Inference:
                 path = data
                 guessed = mimetypes.guess_type(path)[0]
                 content_type = content_type or guessed or "application/octet-stream"
-                with open(path, "rb") as f:
-                    raw_bytes = f.read()
+                upload_path = path
                 if not options.filename:
                     options.filename = os.path.basename(path)
             elif data.startswith("data:"):
@@ -757,6 +794,12 @@ class Inference:
             else:
                 raise ValueError("upload_file expected bytes, data URI, base64 string, or existing file path")
 
+        size = os.path.getsize(upload_path) if upload_path else len(raw_bytes)
+        if not size:
+            # An empty file object goes out chunked with no Content-Length,
+            # which signed-URL PUTs reject; send an empty body instead
+            upload_path = None
+
         file_req = {
             "files": [
                 {
@@ -764,7 +807,7 @@ class Inference:
                     "filename": options.filename,
                     "content_type": content_type,
                     "path": options.path,
-                    "size": len(raw_bytes),
+                    "size": size,
                     "public": options.public,
                 }
             ]
@@ -778,7 +821,8 @@ class Inference:
 
         # Upload to S3 (or compatible) signed URL
         requests = _require_requests()
-        put_resp = requests.put(upload_url, data=raw_bytes, headers={"Content-Type": content_type})
+        with open(upload_path, "rb") if upload_path else contextlib.nullcontext(raw_bytes) as body:
+            put_resp = requests.put(upload_url, data=body, headers={"Content-Type": content_type})
         if not (200 <= put_resp.status_code < 300):
             raise RuntimeError(f"Failed to upload file content: {put_resp.reason}")
         return file_obj
@@ -899,7 +943,7 @@ class Inference:
                 continue
 
             try:
-                parsed = json.loads(line)
+                parsed = _json_loads(line)
             except json.JSONDecodeError:
                 continue
 
@@ -1019,6 +1063,15 @@ class Inference:
 class AsyncInference:
     """Async client for inference.sh API, mirroring the JS SDK behavior.
 
+    The client keeps a pooled HTTP session so consecutive calls reuse
+    keep-alive connections. Create one client and share it across your
+    app, and close it with ``await client.aclose()`` (or use it as an
+    async context manager) when done.
+
+    At most ``max_concurrent_calls`` API requests are in flight at once.
+    From 4 up, a quarter of those slots is kept for ``priority=True``
+    session calls.
+
     Example:
         ```python
         from inferencesh import async_inference
@@ -1035,10 +1088,26 @@ class AsyncInference:
         ```
     """
 
-    def __init__(self, *, api_key: str, base_url: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        *,
+        api_key: str,
+        base_url: Optional[str] = None,
+        max_concurrent_calls: Optional[int] = 64,
+    ) -> None:
         self._api_key = api_key
         self._base_url = base_url or "https://api.inference.sh"
 
+        # One pooled aiohttp session per client (and event loop), created on first use
+        self._http: Any = None
+        self._http_loop: Any = None
+
+        # Bound on in-flight API requests (None disables it). A quarter of the
+        # slots is reserved for priority calls so they never queue behind bulk
+        # traffic; regular calls get the rest, so the total never exceeds it.
+        self._max_concurrent_calls = max_concurrent_calls
+        self._call_sems: Any = None
+
         # Initialize namespaced APIs
         from .api import AsyncTasksAPI, AsyncFilesAPI, AsyncAgentsAPI, AsyncSessionsAPI
         self._tasks = AsyncTasksAPI(self)
@@ -1070,6 +1139,18 @@ class AsyncInference:
         from .api import AsyncSessionsAPI
         return self._sessions
 
+    async def __aenter__(self) -> "AsyncInference":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP session."""
+        http, self._http, self._http_loop = self._http, None, None
+        if http is not None and not http.closed:
+            await http.close()
+
     # --------------- HTTP helpers ---------------
     def _headers(self) -> Dict[str, str]:
         from . import __version__
@@ -1079,6 +1160,55 @@ class AsyncInference:
             "User-Agent": f"inference-sdk-py/{__version__}",
         }
 
+    async def _session(self) -> Any:
+        """Return the pooled aiohttp session, creating it for the running loop if needed."""
+        import asyncio
+
+        aiohttp = await _require_aiohttp()
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http.closed or self._http_loop is not loop:
+            await self._close_stale_session()
+            connector = aiohttp.TCPConnector(limit=64, limit_per_host=32, keepalive_timeout=60)
+            self._http = aiohttp.ClientSession(connector=connector, json_serialize=_json_dumps_text)
+            self._http_loop = loop
+        return self._http
+
+    async def _close_stale_session(self) -> None:
+        """Close a session left from an earlier event loop (e.g. a previous ``asyncio.run``)."""
+        import asyncio
+
+        http, loop = self._http, self._http_loop
+        self._http, self._http_loop = None, None
+        if http is None or http.closed:
+            return
+        if loop is not None and loop.is_running():
+            # Still serving another thread; close it there
+            asyncio.run_coroutine_threadsafe(http.close(), loop)
+            return
+        try:
+            # Connections are released synchronously; once the old loop is
+            # closed there is nothing left to wait for
+            await http.close()
+        except RuntimeError:
+            # The old loop is idle but open, so its close waiters belong to
+            # it; the connector has already been marked closed
+            pass
+
+    def _call_semaphore(self) -> Any:
+        """Return the semaphore bounding this request, or None if calls are unbounded."""
+        import asyncio
+
+        if not self._max_concurrent_calls:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._call_sems is None or self._call_sems[0] is not loop:
+            limit = self._max_concurrent_calls
+            reserved = limit // 4
+            regular = asyncio.Semaphore(limit - reserved)
+            # Limits below 4 reserve nothing; priority calls share the slots
+            self._call_sems = (loop, regular, asyncio.Semaphore(reserved) if reserved else regular)
+        return self._call_sems[2] if _PRIORITY_CALL.get() else self._call_sems[1]
+
     async def _request(
         self,
         method: str,
@@ -1089,70 +1219,94 @@ class AsyncInference:
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
         expect_stream: bool = False,
+    ) -> Any:
+        sem = self._call_semaphore()
+        if sem is None:
+            return await self._send_request(
+                method, endpoint, params=params, data=data, headers=headers,
+                timeout=timeout, expect_stream=expect_stream,
+            )
+        async with sem:
+            return await self._send_request(
+                method, endpoint, params=params, data=data, headers=headers,
+                timeout=timeout, expect_stream=expect_stream,
+            )
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        expect_stream: bool = False,
     ) -> Any:
         aiohttp = await _require_aiohttp()
         url = f"{self._base_url}{endpoint}"
         merged_headers = {**self._headers(), **(headers or {})}
         timeout_cfg = aiohttp.ClientTimeout(total=timeout or 30)
-        async with aiohttp.ClientSession(timeout=timeout_cfg) as session:
-            async with session.request(
-                method=method.upper(),
-                url=url,
-                params=params,
-                json=data,
-                headers=merged_headers,
-            ) as resp:
-                if expect_stream:
-                    return resp
-                # Read response body as text first (can only read once)
-                response_text = await resp.text()
-                
-                # Try to parse as JSON
-                payload = None
-                try:
-                    payload = json.loads(response_text) if response_text else None
-                except Exception:
-                    pass
+        session = await self._session()
+        async with session.request(
+            method=method.upper(),
+            url=url,
+            params=params,
+            json=data,
+            headers=merged_headers,
+            timeout=timeout_cfg,
+        ) as resp:
+            if expect_stream:
+                return resp
+            # Read response body as text first (can only read once)
+            response_text = await resp.text()
+            
+            # Try to parse as JSON
+            payload = None
+            try:
+                payload = _json_loads(response_text) if response_text else None
+            except Exception:
+                pass
+            
+            # Check for HTTP errors first
+            if not resp.ok:
+                # Check for RequirementsNotMetError (412 with errors array)
+                if resp.status == 412 and payload and isinstance(payload, dict) and "errors" in payload:
+                    raise RequirementsNotMetError.from_response(payload, resp.status)
                 
-                # Check for HTTP errors first
-                if not resp.ok:
-                    # Check for RequirementsNotMetError (412 with errors array)
-                    if resp.status == 412 and payload and isinstance(payload, dict) and "errors" in payload:
-                        raise RequirementsNotMetError.from_response(payload, resp.status)
-                    
-                    # General error handling
-                    error_detail = None
-                    if payload and isinstance(payload, dict):
-                        if payload.get("error"):
-                            err = payload["error"]
-                            if isinstance(err, dict):
-                                error_detail = err.get("message") or json.dumps(err)
-                            else:
-                                error_detail = str(err)
-                        elif payload.get("message"):
-                            error_detail = payload["message"]
-                        else:
-                            # Include full payload if no standard error field
-                            error_detail = json.dumps(payload)
-                    elif response_text:
-                        error_detail = response_text[:500]
-                    
-                    raise APIError(resp.status, error_detail or "Request failed", response_text)
-
-                # Handle 204 No Content responses (e.g., DELETE operations)
-                if resp.status == 204:
-                    return None
-
-                if not isinstance(payload, dict) or not payload.get("success", False):
-                    message = None
-                    if isinstance(payload, dict) and payload.get("error"):
+                # General error handling
+                error_detail = None
+                if payload and isinstance(payload, dict):
+                    if payload.get("error"):
                         err = payload["error"]
                         if isinstance(err, dict):
-                            message = err.get("message")
+                            error_detail = err.get("message") or json.dumps(err)
                         else:
-                            message = str(err)
-                    raise APIError(resp.status, message or "Request failed", response_text)
-                return payload.get("data")
+                            error_detail = str(err)
+                    elif payload.get("message"):
+                        error_detail = payload["message"]
+                    else:
+                        # Include full payload if no standard error field
+                        error_detail = json.dumps(payload)
+                elif response_text:
+                    error_detail = response_text[:500]
+                
+                raise APIError(resp.status, error_detail or "Request failed", response_text)
+
+            # Handle 204 No Content responses (e.g., DELETE operations)
+            if resp.status == 204:
+                return None
+
+            if not isinstance(payload, dict) or not payload.get("success", False):
+                message = None
+                if isinstance(payload, dict) and payload.get("error"):
+                    err = payload["error"]
+                    if isinstance(err, dict):
+                        message = err.get("message")
+                    else:
+                        message = str(err)
+                raise APIError(resp.status, message or "Request failed", response_text)
+            return payload.get("data")
 
     # --------------- Public API ---------------
     async def run(
@@ -1327,12 +1481,15 @@ class AsyncInference:
         )
 
     # --------------- File upload ---------------
-    async def upload_file(self, data: Union[str, bytes], options: Optional[UploadFileOptions] = None) -> Dict[str, Any]:
+    async def upload_file(self, data: Union[str, bytes, bytearray, memoryview], options: Optional[UploadFileOptions] = None) -> Dict[str, Any]:
         options = options or UploadFileOptions()
         content_type = options.content_type
-        raw_bytes: bytes
-        if isinstance(data, bytes):
-            raw_bytes = data
+        raw_bytes: Union[bytes, memoryview] = b""
+        # Local files are streamed from disk on upload rather than read into memory
+        upload_path: Optional[str] = None
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            # Other buffers go out through a flat byte view, never copied to bytes
+            raw_bytes = data if isinstance(data, bytes) else memoryview(data).cast("B")
             if not content_type:
                 content_type = "application/octet-stream"
         else:
@@ -1340,8 +1497,7 @@ class AsyncInference:
                 path = data
                 guessed = mimetypes.guess_type(path)[0]
                 content_type = content_type or guessed or "application/octet-stream"
-                async with await _aio_open_file(path, "rb") as f:
-                    raw_bytes = await f.read()  # type: ignore[attr-defined]
+                upload_path = path
                 if not options.filename:
                     options.filename = os.path.basename(path)
             elif data.startswith("data:"):
@@ -1356,6 +1512,12 @@ class AsyncInference:
             else:
                 raise ValueError("upload_file expected bytes, data URI, base64 string, or existing file path")
 
+        size = os.path.getsize(upload_path) if upload_path else len(raw_bytes)
+        if not size:
+            # An empty file object goes out chunked with no Content-Length,
+            # which signed-URL PUTs reject; send an empty body instead
+            upload_path = None
+
         file_req = {
             "files": [
                 {
@@ -1363,7 +1525,7 @@ class AsyncInference:
                     "filename": options.filename,
                     "content_type": content_type,
                     "path": options.path,
-                    "size": len(raw_bytes),
+                    "size": size,
                     "public": options.public,
                 }
             ]
@@ -1377,8 +1539,10 @@ class AsyncInference:
 
         aiohttp = await _require_aiohttp()
         timeout_cfg = aiohttp.ClientTimeout(total=60)
-        async with aiohttp.ClientSession(timeout=timeout_cfg) as session:
-            async with session.put(upload_url, data=raw_bytes, headers={"Content-Type": content_type}) as resp:
+        session = await self._session()
+        # aiohttp reads file bodies in chunks off the event loop
+        with open(upload_path, "rb") if upload_path else contextlib.nullcontext(raw_bytes) as body:
+            async with session.put(upload_url, data=body, headers={"Content-Type": content_type}, timeout=timeout_cfg) as resp:
                 if resp.status // 100 != 2:
                     raise RuntimeError(f"Failed to upload file content: {resp.reason}")
         return file_obj
@@ -1436,23 +1600,23 @@ class AsyncInference:
         }
         timeout_cfg = aiohttp.ClientTimeout(total=60)
 
-        async with aiohttp.ClientSession(timeout=timeout_cfg) as session:
-            async with session.get(url, headers=headers) as resp:
-                async for evt in self._aiter_ndjson(resp):
-                    try:
-                        # Process the event to check for completion/errors
-                        result = _process_stream_event(
-                            evt,
-                            task=task,
-                            stopper=None,  # We'll handle stopping via the iterator
-                        )
-                        if result is not None:
-                            yield result
-                            return
-                        yield _strip_task(evt)
-                    except Exception as exc:
-                        yield exc
-                        raise
+        session = await self._session()
+        async with session.get(url, headers=headers, timeout=timeout_cfg) as resp:
+            async for evt in self._aiter_ndjson(resp):
+                try:
+                    # Process the event to check for completion/errors
+                    result = _process_stream_event(
+                        evt,
+                        task=task,
+                        stopper=None,  # We'll handle stopping via the iterator
+                    )
+                    if result is not None:
+                        yield result
+                        return
+                    yield _strip_task(evt)
+                except Exception as exc:
+                    yield exc
+                    raise
 
     async def _aiter_ndjson(self, resp: Any) -> AsyncIterator[Dict[str, Any]]:
         """Iterate JSON objects from an NDJSON response asynchronously."""
@@ -1465,7 +1629,7 @@ class AsyncInference:
                 continue
 
             try:
-                parsed = json.loads(line)
+                parsed = _json_loads(line)
             except json.JSONDecodeError:
                 continue
 
@@ -1548,12 +1712,6 @@ def _b64_to_bytes(b64: str) -> bytes:
     return base64.b64decode(b64)
 
 
-async def _aio_open_file(path: str, mode: str):
-    import aiofiles  # type: ignore
-
-    return await aiofiles.open(path, mode)
-
-
 def _looks_like_base64(value: str) -> bool:
     # Reject very short strings to avoid matching normal words like "hi"
     if len(value) < 16:
@@ -2,7 +2,9 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, ConfigDict, Field
 import inspect
 import ast
+import copy
 import textwrap
+import weakref
 from collections import OrderedDict
 from inferencesh.models.file import File
 from inferencesh.models.output_meta import OutputMeta
@@ -24,11 +26,30 @@ class Metadata(BaseModel):
         extra = "allow"
 
 
+# Generated schemas per model class and call arguments. Building one walks the
+# model graph and re-parses the class source, so it is done once per class.
+_schema_cache: "weakref.WeakKeyDictionary[type, Dict[Any, Dict[str, Any]]]" = weakref.WeakKeyDictionary()
+
+
 class OrderedSchemaModel(BaseModel):
     """A base model that ensures the JSON schema properties and required fields are in the order of field definition."""
 
     @classmethod
     def model_json_schema(cls, by_alias: bool = True, **kwargs: Any) -> Dict[str, Any]:
+        try:
+            key = (by_alias, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            return cls._build_json_schema(by_alias, **kwargs)
+
+        cached = _schema_cache.setdefault(cls, {})
+        if key not in cached:
+            cached[key] = cls._build_json_schema(by_alias, **kwargs)
+        # Callers may mutate the result; keep the cached copy pristine
+        return copy.deepcopy(cached[key])
+
+    @classmethod
+    def _build_json_schema(cls, by_alias: bool, **kwargs: Any) -> Dict[str, Any]:
         schema = super().model_json_schema(by_alias=by_alias, **kwargs)
 
         field_order = cls._get_field_order()
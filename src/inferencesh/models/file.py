@@ -1,17 +1,578 @@
-from typing import Optional, Union, Any, Tuple
+from typing import IO, Optional, Union, Any, Dict, Tuple, List
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import CoreSchema, core_schema
+import asyncio
+import atexit
 import base64
+import copy
+import functools
+import json
 import mimetypes
+import operator
 import os
 import re
-import urllib.request
+import shutil
+import sys
+import threading
+import time
 import urllib.parse
+import weakref
 import hashlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from tqdm import tqdm
 
 
+# Load the system mime.types tables up front instead of on the first guess
+mimetypes.init()
+
+
+# Cache-key hash scheme. Cache paths persist across runs, so the default stays
+# on SHA-256; set FILE_CACHE_HASH_VERSION to opt into a faster hash.
+#   1: sha256 (default)   2: blake2b (stdlib)   3: xxh3 (requires xxhash)
+_HASH_VERSIONS = ("1", "2", "3")
+
+
+def _hash_version() -> str:
+    return os.environ.get("FILE_CACHE_HASH_VERSION", "1")
+
+
+def _hash_hex(data: bytes, length: int, version: Optional[str] = None) -> str:
+    """Hex digest of ``data`` truncated to ``length`` chars, per FILE_CACHE_HASH_VERSION."""
+    version = version or _hash_version()
+    if version not in _HASH_VERSIONS:
+        raise ValueError(f"Unsupported FILE_CACHE_HASH_VERSION: {version!r}")
+    if version == "2":
+        return hashlib.blake2b(data, digest_size=(length + 1) // 2).hexdigest()[:length]
+    if version == "3":
+        try:
+            import xxhash  # type: ignore
+        except Exception as exc:  # pragma: no cover - dependency hint
+            raise RuntimeError(
+                "The 'xxhash' package is required for FILE_CACHE_HASH_VERSION=3. Install with: pip install xxhash"
+            ) from exc
+        return xxhash.xxh3_128_hexdigest(data)[:length]
+    return hashlib.sha256(data).hexdigest()[:length]
+
+
+@functools.lru_cache(maxsize=4096)
+def _compute_cache_key(url: str, hash_version: str) -> Tuple[str, str]:
+    """Map a URL to its (hash directory, filename) pair inside the cache."""
+    parsed_url = urllib.parse.urlparse(url)
+    url_components = parsed_url.netloc + parsed_url.path
+    if parsed_url.query:
+        url_components += "?" + parsed_url.query
+    url_hash = _hash_hex(url_components.encode(), 12, hash_version)
+
+    filename = os.path.basename(parsed_url.path)
+    if not filename:
+        filename = "download"
+    return url_hash, filename
+
+
+@functools.lru_cache(maxsize=256)
+def _content_type_for_ext(ext: str) -> Optional[str]:
+    """MIME type for a lowercased extension such as ``".png"``."""
+    return mimetypes.guess_type("x" + ext)[0]
+
+
+# Types for the media this SDK handles most, answered before consulting the
+# mimetypes registry. Also keeps them stable where the platform tables lack an
+# entry (e.g. .webp on older Pythons without a system mime.types).
+_MIME_FAST = {
+    ".txt": "text/plain",
+    ".json": "application/json",
+    ".csv": "text/csv",
+    ".pdf": "application/pdf",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".svg": "image/svg+xml",
+    ".mp4": "video/mp4",
+    ".webm": "video/webm",
+    ".mov": "video/quicktime",
+    ".mp3": "audio/mpeg",
+}
+
+
+def _guess_type(path: str) -> Optional[str]:
+    ext = os.path.splitext(path)[1].lower()
+    fast = _MIME_FAST.get(ext)
+    if fast is not None:
+        return fast
+    if ext in mimetypes.encodings_map or ext in mimetypes.suffix_map:
+        # ".tar.gz"/".tgz" resolve through the inner extension; not keyable by ext alone
+        return mimetypes.guess_type(path)[0]
+    return _content_type_for_ext(ext)
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> Path:
+    """Create ``path`` once per process and return it as a Path."""
+    result = Path(path)
+    result.mkdir(parents=True, exist_ok=True)
+    return result
+
+
+# Opt-in memo of resolved Files for repeated pydantic validation of the same input.
+# Off by default: hits skip the resolve, so on-disk changes go unnoticed.
+_FILE_FIELDS = ("uri", "path", "content_type", "size", "filename")
+_FILE_FIELD_SET = frozenset(_FILE_FIELDS)
+
+# Serialized values in _FILE_FIELDS order, fetched in one C-level call. Reads
+# _path rather than path so serializing never triggers a download.
+_file_ser_values = operator.attrgetter("uri", "_path", "content_type", "size", "filename")
+
+
+# Longest uri/path worth interning or memoizing; longer ones are inline data
+_SHORT_STR_MAX = 2048
+
+
+def _validate_cache_enabled() -> bool:
+    return os.environ.get("FILE_VALIDATE_CACHE", "").lower() in ("1", "true", "yes")
+
+
+def _memoizable_uri(uri: Any) -> bool:
+    """Whether a uri may key the validation memo.
+
+    Inline data URIs (and any very long string) are kept out: the memo
+    would hold up to 4096 of them alive as keys.
+    """
+    return not isinstance(uri, str) or (len(uri) < _SHORT_STR_MAX and not uri.startswith("data:"))
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolved_file(cls: type, uri: Any, path: Any, content_type: Any, size: Any, filename: Any) -> "File":
+    """Build and fully populate a File; callers hand out copies, never this instance."""
+    file = cls(uri=uri, path=path, content_type=content_type, size=size, filename=filename)
+    # Compute the lazy metadata now so every copy inherits it
+    for name in ("content_type", "size", "filename"):
+        getattr(file, name)
+    return file
+
+
+# Headers sent with every download; built once and never mutated
+_DEFAULT_HEADERS = {"User-Agent": "inferencesh-sdk-py"}
+
+# Shared HTTP session so repeated downloads reuse pooled keep-alive connections
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session():
+    """Return the process-wide ``requests.Session`` used for URL downloads."""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                session = requests.Session()
+                # Transient connect failures and 5xx/429 are retried on the pooled
+                # connection before the download loop's own retry/resume kicks in
+                retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+                adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _http_session = session
+    return _http_session
+
+
+# Downloads currently in progress, keyed on cache path. The first caller for a
+# path performs the transfer; concurrent callers wait on the same future.
+_inflight: Dict[str, "Future[None]"] = {}
+_inflight_lock = threading.Lock()
+_ainflight: Dict[Tuple[asyncio.AbstractEventLoop, str], "asyncio.Task[None]"] = {}
+
+
+def _revalidate_enabled() -> bool:
+    return os.environ.get("FILE_CACHE_REVALIDATE", "").lower() in ("1", "true", "yes")
+
+
+def _cache_meta_path(cache_path: Path) -> Path:
+    return cache_path.with_name(cache_path.name + ".meta.json")
+
+
+def _read_cache_meta(cache_path: Path) -> Optional[dict]:
+    """Load the ETag/Last-Modified sidecar stored next to a cached download."""
+    try:
+        with open(_cache_meta_path(cache_path)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache_meta(cache_path: Path, headers: Any) -> None:
+    etag = headers.get("etag")
+    last_modified = headers.get("last-modified")
+    if not etag and not last_modified:
+        return
+    try:
+        meta = {"etag": etag, "last_modified": last_modified, "size": os.path.getsize(cache_path)}
+        with open(_cache_meta_path(cache_path), "w") as f:
+            json.dump(meta, f)
+    except OSError:
+        pass
+
+
+def _absolute(path: str) -> str:
+    """Absolute form of a local path, resolved once when a File is built.
+
+    Absolute paths are kept verbatim; only relative ones pay for getcwd and
+    normalization. The result is stored, so ``File.path`` is a plain read.
+    """
+    return _intern(path if os.path.isabs(path) else os.path.abspath(path))
+
+
+# CPython 3.12 makes interned strings immortal, so every unique signed URL
+# or cache path would stay in memory for the life of a worker
+_INTERN_IS_MORTAL = sys.version_info[:2] != (3, 12)
+
+
+def _intern(value: Any) -> Any:
+    """Intern short uri/path strings so Files fanned out from one input share them.
+
+    Very long strings (inline data URIs) are left alone. Elsewhere than on
+    3.12, interned strings are freed once nothing references them.
+    """
+    if _INTERN_IS_MORTAL and type(value) is str and len(value) < _SHORT_STR_MAX:
+        return sys.intern(value)
+    return value
+
+
+def _safe_unlink(path: str) -> None:
+    try:
+        os.unlink(path)
+    except (OSError, IOError):
+        pass
+
+
+# Optional bounds on the download cache. FILE_CACHE_TTL (seconds) re-downloads
+# entries older than that; FILE_CACHE_MAX_BYTES evicts least recently used
+# entries after each download. Recency is the file's atime, set explicitly on
+# every hit so it works on noatime/relatime mounts; mtime stays the download time.
+def _cache_ttl() -> Optional[float]:
+    value = os.environ.get("FILE_CACHE_TTL")
+    return float(value) if value else None
+
+
+def _cache_max_bytes() -> Optional[int]:
+    value = os.environ.get("FILE_CACHE_MAX_BYTES")
+    return int(value) if value else None
+
+
+def _cache_entry_fresh(cache_path: Path) -> bool:
+    """Whether a cached download can be used as is, marking it recently used."""
+    try:
+        st = os.stat(cache_path)
+    except OSError:
+        return False
+    now = time.time()
+    ttl = _cache_ttl()
+    if ttl is not None and now - st.st_mtime > ttl:
+        return False
+    if _cache_max_bytes():
+        try:
+            os.utime(cache_path, (now, st.st_mtime))
+        except OSError:
+            pass
+    return True
+
+
+def _evict_cache(cache_dir: Path, max_bytes: int, keep: Path) -> None:
+    """Remove least recently used downloads until the cache fits in ``max_bytes``.
+
+    Best effort: other threads and processes may be evicting or downloading
+    at the same time, so entries that vanish mid-scan are skipped.
+    """
+    entries = []
+    total = 0
+    try:
+        hash_dirs = list(os.scandir(cache_dir))
+    except OSError:
+        return
+    for hash_dir in hash_dirs:
+        try:
+            if hash_dir.name.startswith(".") or not hash_dir.is_dir():
+                continue
+            files = list(os.scandir(hash_dir.path))
+        except OSError:
+            continue
+        for entry in files:
+            try:
+                if entry.name.endswith(".meta.json") or not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            total += st.st_size
+            entries.append((st.st_atime, st.st_size, entry.path))
+
+    entries.sort()
+    for _atime, size, path in entries:
+        if total <= max_bytes:
+            break
+        if path == str(keep):
+            continue
+        _safe_unlink(path)
+        _safe_unlink(str(_cache_meta_path(Path(path))))
+        try:
+            os.rmdir(os.path.dirname(path))
+        except OSError:
+            pass
+        total -= size
+
+
+def _preallocate(fd: int, offset: int, total_size: int) -> None:
+    """Reserve disk blocks for the rest of a download of known size.
+
+    Large weight files otherwise grow one write at a time, which costs an
+    extent/metadata update per write and fragments the file. Best effort:
+    unsupported platforms and filesystems just skip it. Callers truncate
+    to the bytes actually written, so a short body never leaves padding.
+    """
+    if total_size > offset and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, offset, total_size - offset)
+        except OSError:
+            pass
+
+
+# Staging dirs of dead processes are only reclaimed once nothing in them has
+# been written for this long, so a live process in another PID namespace
+# sharing the cache dir is never mistaken for a crashed one.
+_STALE_STAGING_AGE = 3600
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether ``pid`` is a running process; ``True`` when it cannot be told."""
+    if os.name == "nt":
+        # os.kill would terminate the process rather than probe it
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _reclaim_stale_staging(root: Path) -> None:
+    """Remove staging dirs left by processes that died without running atexit."""
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    cutoff = time.time() - _STALE_STAGING_AGE
+    for entry in entries:
+        if not entry.name.isdigit() or int(entry.name) == os.getpid() or _pid_alive(int(entry.name)):
+            continue
+        try:
+            newest = max([entry.stat().st_mtime] + [f.stat().st_mtime for f in os.scandir(entry.path)])
+        except OSError:
+            continue
+        if newest < cutoff:
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _staging_dir(cache_dir: Path, pid: int) -> Path:
+    """Per-process directory for in-progress downloads, removed at exit.
+
+    It lives inside the cache dir so the final rename never crosses
+    filesystems, and is per process so exit cleanup cannot remove another
+    process's partial downloads. Only the path, the exit hook and the sweep
+    of crashed processes' dirs and abandoned partials are done once; ``_stage_tmp`` creates the
+    directory on every download, so clearing the cache dir is harmless.
+    """
+    root = cache_dir / ".staging"
+    _reclaim_stale_staging(root)
+    _reclaim_stale_partials(cache_dir / ".partial")
+    path = root / str(pid)
+    atexit.register(shutil.rmtree, str(path), ignore_errors=True)
+    return path
+
+
+# Interrupted downloads that a later call or process can resume live under
+# <cache>/.partial, one per cache entry: <key>.part holds the body,
+# <key>.part.json its validator and how many bytes of it are safely on disk,
+# and <key>.part.lock is locked by whichever process is writing it. The OS
+# drops the lock when that process dies, so a crash leaves the partial free
+# to be resumed. Progress is recorded at least every _PARTIAL_CHECKPOINT
+# bytes; a preallocated tail past it is never trusted.
+_PARTIAL_CHECKPOINT = 64 * 1024 * 1024
+# Partials nobody has resumed for this long are removed
+_STALE_PARTIAL_AGE = 7 * 24 * 3600
+
+
+def _partial_path(cache_dir: Path, cache_path: Path) -> str:
+    root = cache_dir / ".partial"
+    root.mkdir(parents=True, exist_ok=True)
+    return str(root / f"{cache_path.parent.name}-{cache_path.name}.part")
+
+
+def _lock_file(path: str) -> Optional[int]:
+    """Take a non-blocking exclusive lock on ``path``; the fd, or ``None`` if it is held."""
+    try:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    except OSError:
+        return None
+    try:
+        if os.name == "nt":
+            import msvcrt
+
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        # The holder may have removed the file between our open and lock
+        if os.fstat(fd).st_ino != os.stat(path).st_ino:
+            raise OSError("lock file replaced")
+    except OSError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _read_partial(partial: str, url: str) -> Optional[Dict[str, Any]]:
+    """Resume state recorded for ``partial``, if it belongs to ``url``."""
+    try:
+        with open(partial + ".json") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get("url") != url or not state.get("validator"):
+        return None
+    if not isinstance(state.get("written"), int):
+        return None
+    return state
+
+
+def _write_partial(partial: str, state: Dict[str, Any]) -> None:
+    try:
+        with open(partial + ".json", "w") as f:
+            json.dump(state, f)
+    except OSError:
+        pass
+
+
+def _reclaim_stale_partials(root: Path) -> None:
+    """Remove partials that have not been resumed for a long time and are not in use."""
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    cutoff = time.time() - _STALE_PARTIAL_AGE
+    for entry in entries:
+        if not entry.name.endswith(".part"):
+            continue
+        try:
+            if entry.stat().st_mtime >= cutoff:
+                continue
+        except OSError:
+            continue
+        fd = _lock_file(entry.path + ".lock")
+        if fd is None:
+            continue
+        for path in (entry.path, entry.path + ".json", entry.path + ".lock"):
+            _safe_unlink(path)
+        os.close(fd)
+
+
+def _copy_body(src: Any, dst: Any, out_file: IO[bytes], checkpoint: Any = None) -> None:
+    """Copy a response body; with ``checkpoint``, flush and report progress periodically."""
+    if checkpoint is None:
+        shutil.copyfileobj(src, dst, length=1024 * 1024)
+        return
+    next_mark = out_file.tell() + _PARTIAL_CHECKPOINT
+    while True:
+        chunk = src.read(1024 * 1024)
+        if not chunk:
+            return
+        dst.write(chunk)
+        if out_file.tell() >= next_mark:
+            out_file.flush()
+            checkpoint(out_file.tell())
+            next_mark = out_file.tell() + _PARTIAL_CHECKPOINT
+
+
+# Background executor for File.prefetch, created on first use
+_prefetch_executor: Optional[ThreadPoolExecutor] = None
+_prefetch_executor_lock = threading.Lock()
+
+
+def _get_prefetch_executor() -> ThreadPoolExecutor:
+    global _prefetch_executor
+    if _prefetch_executor is None:
+        with _prefetch_executor_lock:
+            if _prefetch_executor is None:
+                _prefetch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="inferencesh-prefetch")
+    return _prefetch_executor
+
+
+# Shared aiohttp session for async downloads, bound to the loop that created it
+_async_session = None
+_async_session_loop = None
+
+
+async def _get_async_session():
+    """Return the shared ``aiohttp.ClientSession`` used for async URL downloads."""
+    global _async_session, _async_session_loop
+    loop = asyncio.get_running_loop()
+    if _async_session is not None and not _async_session.closed and _async_session_loop is not loop:
+        stale, stale_loop = _async_session, _async_session_loop
+        _async_session, _async_session_loop = None, None
+        await _close_stale_session(stale, stale_loop)
+    if _async_session is None or _async_session.closed:
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(limit=16, keepalive_timeout=60)
+        _async_session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=60),
+        )
+        _async_session_loop = loop
+    return _async_session
+
+
+async def _close_stale_session(session: Any, loop: Any) -> None:
+    """Close a session left from an earlier event loop (e.g. a previous ``asyncio.run``)."""
+    if loop is not None and loop.is_running():
+        # Still serving another thread; close it there
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+        return
+    try:
+        # Connections are released synchronously; once the old loop is
+        # closed there is nothing left to wait for
+        await session.close()
+    except RuntimeError:
+        # The old loop is idle but open, so its close waiters belong to
+        # it; the connector has already been marked closed
+        pass
+
+
+@atexit.register
+def _close_async_session() -> None:
+    session, loop = _async_session, _async_session_loop
+    if session is None or session.closed or loop is None:
+        return
+    if not loop.is_closed() and not loop.is_running():
+        try:
+            loop.run_until_complete(session.close())
+        except Exception:
+            pass
+
+
+# File slots that are never copied or pickled (see File.__getstate__)
+_FILE_INSTANCE_SLOTS = frozenset(("_fd", "_fd_closer", "_tmp_path", "_finalizer", "_dump", "__weakref__"))
+
+
 class File:
     """A file in the inference.sh ecosystem.
 
@@ -28,10 +589,36 @@ class File:
     # or resolve files at the kernel boundary before app execution.
     """
 
+    __slots__ = (
+        "uri",
+        "_path",
+        "_resolved",
+        "_content_type",
+        "_size",
+        "_filename",
+        "_stat",
+        "_dump",
+        "_fd",
+        "_fd_closer",
+        "_tmp_path",
+        "_finalizer",
+        "__weakref__",
+    )
+
     uri: Optional[str]
-    content_type: Optional[str]
-    size: Optional[int]
-    filename: Optional[str]
+    _path: Optional[str]
+    _resolved: bool
+    _content_type: Optional[str]
+    _size: Optional[int]
+    _filename: Optional[str]
+    _stat: Optional[os.stat_result]
+    # (uri, path, serialized dict) from the last dump; see _pydantic_serialize
+    _dump: Optional[Tuple[Optional[str], Optional[str], dict]]
+    # Descriptor kept by from_open_file() so stats skip the path lookup
+    _fd: Optional[int]
+    _fd_closer: Optional[weakref.finalize]
+    _tmp_path: Optional[str]
+    _finalizer: Optional[weakref.finalize]
 
     def __init__(
         self,
@@ -48,11 +635,27 @@ class File:
             if isinstance(initializer, str):
                 uri = initializer
             elif isinstance(initializer, File):
+                if initializer._path and os.path.isabs(initializer._path):
+                    # Already resolved: copy its state instead of resolving again
+                    self.uri = initializer.uri
+                    self._path = initializer._path
+                    self._resolved = True
+                    self._content_type = content_type or initializer._content_type
+                    self._size = size or initializer._size
+                    self._filename = filename or initializer._filename
+                    self._stat = initializer._stat
+                    self._dump = None
+                    self._fd = None
+                    self._fd_closer = None
+                    self._tmp_path = None
+                    self._finalizer = None
+                    return
                 uri = initializer.uri
                 path = initializer._path
-                content_type = content_type or initializer.content_type
-                size = size or initializer.size
-                filename = filename or initializer.filename
+                # Backing fields only: unset metadata stays lazy on the copy too
+                content_type = content_type or initializer._content_type
+                size = size or initializer._size
+                filename = filename or initializer._filename
             elif isinstance(initializer, dict):
                 uri = initializer.get("uri", uri)
                 path = initializer.get("path", path)
@@ -65,24 +668,28 @@ class File:
         if not uri and not path:
             raise ValueError("Either 'uri' or 'path' must be provided")
 
-        self.uri = uri
-        self._path: Optional[str] = None
+        self.uri = _intern(uri)
+        self._path = None
         self._resolved = False
-        self.content_type = content_type
-        self.size = size
-        self.filename = filename
-        self._tmp_path: Optional[str] = None
+        # Metadata not given up front is derived from the local file on first access
+        self._content_type = content_type
+        self._size = size
+        self._filename = filename
+        self._stat = None
+        self._dump = None
+        self._fd = None
+        self._fd_closer = None
+        self._tmp_path = None
+        self._finalizer = None
 
         # If a local path was provided directly, use it immediately
         if path:
-            self._path = os.path.abspath(path)
+            self._path = _absolute(path)
             self._resolved = True
-            self._populate_metadata()
         # If URI is a local path (not URL or data URI), resolve it immediately
         elif self.uri and not self._is_url(self.uri) and not self._is_data_uri(self.uri):
-            self._path = os.path.abspath(self.uri)
+            self._path = _absolute(self.uri)
             self._resolved = True
-            self._populate_metadata()
         # Eagerly resolve URLs and data URIs
         elif self.uri:
             if self._is_data_uri(self.uri):
@@ -100,29 +707,91 @@ class File:
     def path(self, value: Optional[str]) -> None:
         """Set the local path directly."""
         self._path = value
+        self._stat = None
+        self._dump = None
         self._resolved = True
+        # A kept descriptor belongs to the old path
+        if self._fd_closer is not None:
+            self._fd_closer()
+            self._fd = self._fd_closer = None
+
+    @property
+    def content_type(self) -> Optional[str]:
+        """MIME type, guessed from the local path if not provided."""
+        if not self._content_type and self._path:
+            self._content_type = self._guess_content_type()
+        return self._content_type
+
+    @content_type.setter
+    def content_type(self, value: Optional[str]) -> None:
+        self._content_type = value
+        self._dump = None
+
+    @property
+    def size(self) -> Optional[int]:
+        """Size in bytes, read from disk if not provided."""
+        if not self._size and self._path:
+            try:
+                self._size = self._get_file_size()
+            except OSError:
+                pass
+        return self._size
+
+    @size.setter
+    def size(self, value: Optional[int]) -> None:
+        self._size = value
+        self._dump = None
+
+    @property
+    def filename(self) -> Optional[str]:
+        """Base name of the local path if not provided."""
+        if not self._filename and self._path:
+            self._filename = self._get_filename()
+        return self._filename
+
+    @filename.setter
+    def filename(self, value: Optional[str]) -> None:
+        self._filename = value
+        self._dump = None
 
     # --- Pydantic integration (custom type, not a BaseModel) ---
 
     @classmethod
     def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        # The schema only depends on the class, so each class builds it once.
+        # pydantic annotates the returned dict's metadata in place (e.g. for
+        # WithJsonSchema or Field extras), so every use gets its own copy.
+        schema = copy.copy(_file_core_schema(cls))
+        schema["metadata"] = {key: list(value) for key, value in schema["metadata"].items()}
+        return schema
+
+    @classmethod
+    def _build_core_schema(cls) -> CoreSchema:
         return core_schema.no_info_plain_validator_function(
             cls._pydantic_validate,
             serialization=core_schema.plain_serializer_function_ser_schema(cls._pydantic_serialize),
-            metadata={
-                "pydantic_js_functions": [
-                    lambda _s, _h: {"type": "string", "format": "file"}
-                ]
-            },
+            metadata={"pydantic_js_functions": [_file_json_schema]},
         )
 
     @classmethod
     def _pydantic_validate(cls, v: Any) -> Optional["File"]:
+        # Identity check first: already-built Files are the common case
+        if type(v) is cls:
+            return v
         # Empty values become None
         if v is None or v == "" or v == {}:
             return None
         if isinstance(v, cls):
             return v
+        if _validate_cache_enabled():
+            if isinstance(v, str) and _memoizable_uri(v):
+                return cls(_resolved_file(cls, v, None, None, None, None))
+            if isinstance(v, dict) and v.keys() <= _FILE_FIELD_SET and _memoizable_uri(v.get("uri")):
+                try:
+                    cached = _resolved_file(cls, *(v.get(k) for k in _FILE_FIELDS))
+                except TypeError:  # unhashable values can't be cache keys
+                    return cls(**v)
+                return cls(cached)
         if isinstance(v, str):
             return cls(v)
         if isinstance(v, dict):
@@ -131,45 +800,127 @@ class File:
 
     @staticmethod
     def _pydantic_serialize(v: "File") -> dict:
-        result: dict[str, Any] = {}
-        if v.uri is not None:
-            result["uri"] = v.uri
-        # Use _path to avoid triggering download during serialization
-        if v._path is not None:
-            result["path"] = v._path
-        if v.content_type is not None:
-            result["content_type"] = v.content_type
-        if v.size is not None:
-            result["size"] = v.size
-        if v.filename is not None:
-            result["filename"] = v.filename
-        return result
+        # Reuse the last dump unless uri/path were reassigned; the metadata
+        # setters (and so refresh_metadata) drop it themselves
+        cached = v._dump
+        if cached is not None and cached[0] is v.uri and cached[1] is v._path:
+            return dict(cached[2])
+        values = _file_ser_values(v)
+        dump = {k: val for k, val in zip(_FILE_FIELDS, values) if val is not None}
+        # Cache only once the lazy metadata is settled; an empty field is read
+        # from disk again next time (e.g. an output serialized before it is written)
+        if all(values[2:]):
+            v._dump = (v.uri, v._path, dump)
+            return dict(dump)
+        return dump
 
     # --- Cache ---
 
     @classmethod
     def get_cache_dir(cls) -> Path:
-        if cache_dir := os.environ.get("FILE_CACHE_DIR"):
-            path = Path(cache_dir)
-        else:
-            path = Path.home() / ".cache" / "inferencesh" / "files"
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        cache_dir = os.environ.get("FILE_CACHE_DIR") or str(Path.home() / ".cache" / "inferencesh" / "files")
+        return _ensure_dir(cache_dir)
 
-    def _get_cache_path(self, url: str) -> Path:
-        parsed_url = urllib.parse.urlparse(url)
-        url_components = parsed_url.netloc + parsed_url.path
-        if parsed_url.query:
-            url_components += "?" + parsed_url.query
-        url_hash = hashlib.sha256(url_components.encode()).hexdigest()[:12]
+    @classmethod
+    def _get_cache_path(cls, url: str) -> Path:
+        # The hash directory is created by the download, not on lookup
+        url_hash, filename = _compute_cache_key(url, _hash_version())
+        return cls.get_cache_dir() / url_hash / filename
 
-        filename = os.path.basename(parsed_url.path)
-        if not filename:
-            filename = "download"
+    @classmethod
+    def close_session(cls) -> None:
+        """Close the pooled HTTP session used for downloads (e.g. on shutdown)."""
+        global _http_session
+        with _http_session_lock:
+            if _http_session is not None:
+                _http_session.close()
+                _http_session = None
 
-        cache_dir = self.get_cache_dir() / url_hash
-        cache_dir.mkdir(exist_ok=True)
-        return cache_dir / filename
+    @classmethod
+    async def aclose_session(cls) -> None:
+        """Close the shared aiohttp session used for async downloads."""
+        global _async_session, _async_session_loop
+        if _async_session is not None and not _async_session.closed:
+            await _async_session.close()
+        _async_session = None
+        _async_session_loop = None
+
+    # --- Bulk construction ---
+
+    @classmethod
+    def bulk_download(cls, urls: List[str], max_workers: int = 8) -> List["File"]:
+        """Create Files for many URLs, downloading them in parallel threads.
+
+        Results keep the input order. Duplicate URLs are downloaded once.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            return list(ex.map(cls, urls))
+
+    @classmethod
+    def prefetch(cls, urls: List[str]) -> List["Future[File]"]:
+        """Start downloading URLs into the cache in the background.
+
+        Returns immediately with one future per URL; later ``File(url)``
+        constructions hit the warm cache.
+        """
+        executor = _get_prefetch_executor()
+        return [executor.submit(cls, url) for url in urls]
+
+    # --- Async construction ---
+
+    @classmethod
+    async def afrom_url(cls, url: str) -> "File":
+        """Create a File from a URL without blocking the event loop on the download."""
+        cache_path = cls._get_cache_path(url)
+        file = cls(uri=url, path=str(cache_path))
+        if not _cache_entry_fresh(cache_path):
+            await file._adownload_url()
+        return file
+
+    @classmethod
+    async def gather(cls, initializers: List[Any], limit: int = 16) -> List["File"]:
+        """Resolve many files concurrently, downloading URLs over one shared session.
+
+        Accepts the same initializers as the constructor. At most ``limit``
+        downloads are in flight at once; results keep the input order.
+        """
+        sem = asyncio.Semaphore(limit)
+
+        async def _one(initializer: Any) -> "File":
+            uri = initializer
+            if isinstance(initializer, dict) and not initializer.get("path"):
+                uri = initializer.get("uri")
+            if isinstance(uri, str) and cls._is_url(uri):
+                async with sem:
+                    file = await cls.afrom_url(uri)
+                if isinstance(initializer, dict):
+                    # Cache is warm now, so this resolves without a download
+                    return cls(initializer)
+                return file
+            return cls(initializer)
+
+        return list(await asyncio.gather(*(_one(i) for i in initializers)))
+
+    @classmethod
+    async def prefetch_all(cls, uris: List[str], concurrency: int = 16) -> List["File"]:
+        """Download many URLs concurrently and return resolved Files in input order.
+
+        Total time tracks the slowest download rather than the sum. Already
+        cached URLs resolve without a request.
+        """
+        return await cls.gather(uris, limit=concurrency)
+
+    @classmethod
+    def prefetch_all_sync(cls, uris: List[str], concurrency: int = 16) -> List["File"]:
+        """Blocking ``prefetch_all`` for code without a running event loop."""
+        async def _run() -> List["File"]:
+            try:
+                return await cls.prefetch_all(uris, concurrency)
+            finally:
+                # The session is bound to this short-lived loop
+                await cls.aclose_session()
+
+        return asyncio.run(_run())
 
     # --- Helpers ---
 
@@ -177,9 +928,47 @@ class File:
     def from_path(cls, path: Union[str, os.PathLike]) -> "File":
         return cls(uri=str(path))
 
+    @classmethod
+    def from_open_file(cls, f: IO[bytes]) -> "File":
+        """Create a File from an open file, keeping a duplicate of its descriptor.
+
+        Size and existence checks then use ``os.fstat`` on that descriptor
+        instead of resolving the path each time, which helps on slow or
+        network filesystems. They follow the open inode, so a file replaced
+        by rename is not seen. Flush ``f`` before ``refresh_metadata()`` to
+        count buffered writes. The duplicate is closed with the File.
+        """
+        name = getattr(f, "name", None)
+        if not isinstance(name, (str, os.PathLike)):
+            raise ValueError("from_open_file needs a file opened from a filesystem path")
+        file = cls(path=os.fspath(name))
+        file._fd = os.dup(f.fileno())
+        file._fd_closer = weakref.finalize(file, os.close, file._fd)
+        return file
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Used by copy, deepcopy and pickle. A kept descriptor and a staged
+        # download belong to this instance; copies carry only the file's data
+        state = dict(getattr(self, "__dict__", {}))
+        for name in File.__slots__:
+            if name not in _FILE_INSTANCE_SLOTS and hasattr(self, name):
+                state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name in _FILE_INSTANCE_SLOTS:
+            if name != "__weakref__":
+                setattr(self, name, None)
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def exists(self) -> bool:
-        """Check if the file exists locally (triggers download if needed)."""
-        return self.path is not None and os.path.exists(self.path)
+        """Check if the file exists locally (triggers download if needed).
+
+        A positive result is cached with the file's stat; call
+        ``refresh_metadata()`` after deleting or replacing the file.
+        """
+        return self.path is not None and self.is_local()
 
     def is_resolved(self) -> bool:
         """Check if the file has been downloaded/resolved without triggering download."""
@@ -187,14 +976,27 @@ class File:
 
     def is_local(self) -> bool:
         """Check if we have a local path without triggering download."""
-        return self._path is not None and os.path.exists(self._path)
+        if self._path is None:
+            return False
+        try:
+            self._get_stat()
+        except OSError:
+            return False
+        return True
 
     def refresh_metadata(self) -> None:
         """Re-read metadata from disk (triggers download if needed)."""
-        if self.path and os.path.exists(self._path):
-            self.content_type = self._guess_content_type()
-            self.size = self._get_file_size()
-            self.filename = self._get_filename()
+        self._stat = None
+        if not self.path:
+            return
+        try:
+            # One stat answers both "does it exist" and "how big is it"
+            st = self._get_stat()
+        except OSError:
+            return
+        self.content_type = self._guess_content_type()
+        self.size = st.st_size
+        self.filename = self._get_filename()
 
     def to_dict(self) -> dict:
         return self._pydantic_serialize(self)
@@ -203,8 +1005,8 @@ class File:
 
     @staticmethod
     def _is_url(path: str) -> bool:
-        parsed = urllib.parse.urlparse(path)
-        return parsed.scheme in ("http", "https")
+        # Only http(s) can be downloaded; schemes are case-insensitive
+        return path[:8].lower().startswith(("http://", "https://"))
 
     @staticmethod
     def _is_data_uri(path: str) -> bool:
@@ -256,7 +1058,7 @@ class File:
         uri = self.uri
 
         # Create cache path based on hash of the data URI
-        uri_hash = hashlib.sha256(uri.encode()).hexdigest()[:16]
+        uri_hash = _hash_hex(uri.encode(), 16)
         cache_dir = self.get_cache_dir() / "data_uri" / uri_hash
 
         # Check for existing cached file
@@ -264,7 +1066,6 @@ class File:
             cached_files = list(cache_dir.iterdir())
             if cached_files:
                 self._path = str(cached_files[0])
-                self._populate_metadata()
                 return
 
         # Parse and decode
@@ -283,73 +1084,224 @@ class File:
             with open(cache_path, "wb") as f:
                 f.write(data)
             self._path = str(cache_path)
-            self._populate_metadata()
         except IOError as e:
             raise RuntimeError(f"Failed to write decoded data URI to {cache_path}: {e}")
 
     def _download_url(self, retries: int = 1) -> None:
-        import time
-
         original_url = self.uri
         cache_path = self._get_cache_path(original_url)
 
-        if cache_path.exists():
-            print(f"Using cached file: {cache_path}")
+        key = _intern(str(cache_path))
+        with _inflight_lock:
+            future = _inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                _inflight[key] = future
+
+        if not leader:
+            # Another thread is already fetching this URL; share its result
+            future.result()
+            self._path = key
+            return
+
+        try:
+            if not _cache_entry_fresh(cache_path):
+                self._fetch_to_cache(cache_path, retries)
+            else:
+                validators = _read_cache_meta(cache_path) if _revalidate_enabled() else None
+                if validators:
+                    self._revalidate_cache(cache_path, validators, retries)
+                else:
+                    print(f"Using cached file: {cache_path}")
+                    self._path = key
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(None)
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+
+    def _revalidate_cache(self, cache_path: Path, validators: dict, retries: int = 1) -> None:
+        """Conditionally re-fetch a cached URL, keeping the cached copy on 304 or network errors."""
+        conditional = {}
+        if validators.get("etag"):
+            conditional["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            conditional["If-Modified-Since"] = validators["last_modified"]
+        try:
+            self._fetch_to_cache(cache_path, retries, conditional)
+        except RuntimeError as e:
+            print(f"Revalidation failed, using cached file: {e}")
+            self._path = str(cache_path)
+
+    def _fetch_to_cache(self, cache_path: Path, retries: int = 1, conditional: Optional[dict] = None) -> None:
+        original_url = self.uri
+        if conditional:
+            print(f"Revalidating cached file: {cache_path}")
+        else:
+            print(f"Downloading URL: {original_url} to {cache_path}")
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Download into this entry's resumable partial when no other process
+        # is writing it, otherwise into private staging
+        partial = _partial_path(self.get_cache_dir(), cache_path)
+        lock_fd = _lock_file(partial + ".lock")
+        if lock_fd is None:
+            self._stage_tmp(cache_path)
+            state: Dict[str, Any] = {}
+        else:
+            self._stage_tmp(cache_path, partial)
+            # A conditional fetch replaces the whole body, so never resume into it
+            state = (None if conditional else _read_partial(partial, original_url)) or {}
+            if state:
+                print(f"Resuming partial download: {partial}")
+
+        headers = {**_DEFAULT_HEADERS, **conditional} if conditional else _DEFAULT_HEADERS
+
+        last_err = None
+        try:
+            for attempt in range(retries + 1):
+                try:
+                    request_headers = headers
+                    offset = 0
+                    if state.get("validator"):
+                        try:
+                            offset = min(os.path.getsize(self._tmp_path), state["written"])
+                        except OSError:
+                            offset = 0
+                        if offset:
+                            request_headers = {**headers, "Range": f"bytes={offset}-", "If-Range": state["validator"]}
+
+                    session = _get_http_session()
+                    response = session.get(original_url, headers=request_headers, stream=True, timeout=(5, 60))
+                    if offset and 400 <= response.status_code < 500:
+                        # The partial no longer lines up with the remote body (e.g. 416
+                        # once it already holds all of it); drop it and start over
+                        with response:
+                            pass
+                        _safe_unlink(self._tmp_path)
+                        if lock_fd is not None:
+                            _safe_unlink(partial + ".json")
+                        state = {}
+                        offset = 0
+                        response = session.get(original_url, headers=headers, stream=True, timeout=(5, 60))
+                    with response:
+                        if response.status_code == 304:
+                            print(f"Using cached file: {cache_path}")
+                            self._discard_tmp()
+                            self._path = str(cache_path)
+                            return
+                        response.raise_for_status()
+                        if response.status_code != 206:
+                            offset = 0
+
+                        # Only identity-encoded bodies can be resumed byte-for-byte
+                        validator = None
+                        if not response.headers.get("content-encoding"):
+                            validator = response.headers.get("etag") or response.headers.get("last-modified")
+                        state = {"url": original_url, "validator": validator, "written": offset}
+                        checkpoint = None
+                        if lock_fd is not None:
+                            if validator:
+                                def save_progress(written: int) -> None:
+                                    state["written"] = written
+                                    _write_partial(partial, state)
+
+                                checkpoint = save_progress
+                                checkpoint(offset)
+                            else:
+                                _safe_unlink(partial + ".json")
+
+                        cl = response.headers.get("content-length")
+                        total_size = offset + int(cl) if cl else 0
+
+                        # Let urllib3 undo any Content-Encoding while we copy the raw stream
+                        response.raw.decode_content = True
+                        # Not append mode: appends would land after the preallocated blocks
+                        with open(self._tmp_path, "r+b" if offset else "wb", buffering=1024 * 1024) as out_file:
+                            out_file.seek(offset)
+                            _preallocate(out_file.fileno(), offset, total_size)
+                            try:
+                                with tqdm.wrapattr(
+                                    out_file, "write", total=total_size, initial=offset, unit="iB", unit_scale=True
+                                ) as wrapped:
+                                    _copy_body(response.raw, wrapped, out_file, checkpoint)
+                            finally:
+                                # Drop unused preallocation so a resume starts at the real end of data
+                                out_file.truncate()
+                                state["written"] = out_file.tell()
+                                if checkpoint is not None:
+                                    checkpoint(state["written"])
+
+                        self._commit_tmp(cache_path)
+                        _write_cache_meta(cache_path, response.headers)
+                    break
+                except Exception as e:
+                    last_err = e
+                    if self._tmp_path and not state.get("validator"):
+                        _safe_unlink(self._tmp_path)
+                    if attempt < retries:
+                        wait = 2 ** attempt
+                        print(f"Download failed (attempt {attempt + 1}/{retries + 1}): {e}, retrying in {wait}s...")
+                        time.sleep(wait)
+            else:
+                if self._tmp_path and (lock_fd is None or not state.get("validator")):
+                    _safe_unlink(self._tmp_path)
+                raise RuntimeError(f"Error downloading URL {original_url} after {retries + 1} attempts: {last_err}")
+        finally:
+            if lock_fd is not None:
+                if self._tmp_path and state.get("validator") and os.path.exists(self._tmp_path):
+                    # Leave it for a later call or process to resume
+                    self._release_tmp()
+                else:
+                    _safe_unlink(partial + ".json")
+                    _safe_unlink(partial + ".lock")
+                os.close(lock_fd)
+
+        self._trim_cache(cache_path)
+
+    async def _adownload_url(self, retries: int = 1) -> None:
+        """Async counterpart of ``_download_url`` using the shared aiohttp session."""
+        cache_path = self._get_cache_path(self.uri)
+        if _cache_entry_fresh(cache_path):
             self._path = str(cache_path)
-            self._populate_metadata()
             return
 
+        # Coroutines in this loop asking for the same URL await one download task
+        key = (asyncio.get_running_loop(), str(cache_path))
+        task = _ainflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._afetch_to_cache(cache_path, retries))
+            _ainflight[key] = task
+            task.add_done_callback(lambda _: _ainflight.pop(key, None))
+        await asyncio.shield(task)
+        self._path = str(cache_path)
+
+    async def _afetch_to_cache(self, cache_path: Path, retries: int = 1) -> None:
+        import aiofiles
+
+        original_url = self.uri
         print(f"Downloading URL: {original_url} to {cache_path}")
         cache_path.parent.mkdir(parents=True, exist_ok=True)
-        tmp_path = str(cache_path) + ".tmp"
-        self._tmp_path = tmp_path
-
-        headers = {
-            "User-Agent": "inferencesh-sdk-py"
-        }
+        self._stage_tmp(cache_path)
 
         last_err = None
         for attempt in range(retries + 1):
             try:
-                req = urllib.request.Request(original_url, headers=headers)
-                with urllib.request.urlopen(req, timeout=120) as response:
-                    total_size = 0
-                    try:
-                        if hasattr(response, "headers") and response.headers is not None:
-                            cl = response.headers.get("content-length")
-                            total_size = int(cl) if cl is not None else 0
-                        elif hasattr(response, "getheader"):
-                            cl = response.getheader("content-length")
-                            total_size = int(cl) if cl is not None else 0
-                    except Exception:
-                        total_size = 0
-
-                    block_size = 65536
-
-                    with tqdm(total=total_size, unit="iB", unit_scale=True) as pbar:
-                        with open(self._tmp_path, "wb") as out_file:
-                            while True:
-                                non_chunking = False
-                                try:
-                                    buffer = response.read(block_size)
-                                except TypeError:
-                                    buffer = response.read()
-                                    non_chunking = True
-                                if not buffer:
-                                    break
-                                out_file.write(buffer)
-                                try:
-                                    pbar.update(len(buffer))
-                                except Exception:
-                                    pass
-                                if non_chunking:
-                                    break
-
-                os.rename(self._tmp_path, cache_path)
-                self._tmp_path = None
-                self._path = str(cache_path)
-                self._populate_metadata()
-                return
+                session = await _get_async_session()
+                async with session.get(original_url, headers=_DEFAULT_HEADERS) as response:
+                    response.raise_for_status()
+                    async with aiofiles.open(self._tmp_path, "wb", buffering=1024 * 1024) as out_file:
+                        _preallocate(out_file.fileno(), 0, response.content_length or 0)
+                        async for chunk in response.content.iter_chunked(1024 * 1024):
+                            await out_file.write(chunk)
+                        await out_file.truncate()
+
+                self._commit_tmp(cache_path)
+                break
             except Exception as e:
                 last_err = e
                 if self._tmp_path:
@@ -360,31 +1312,72 @@ class File:
                 if attempt < retries:
                     wait = 2 ** attempt
                     print(f"Download failed (attempt {attempt + 1}/{retries + 1}): {e}, retrying in {wait}s...")
-                    time.sleep(wait)
+                    await asyncio.sleep(wait)
+        else:
+            raise RuntimeError(f"Error downloading URL {original_url} after {retries + 1} attempts: {last_err}")
 
-        raise RuntimeError(f"Error downloading URL {original_url} after {retries + 1} attempts: {last_err}")
+        self._trim_cache(cache_path)
 
-    def __del__(self):
-        if hasattr(self, "_tmp_path") and self._tmp_path:
-            try:
-                os.unlink(self._tmp_path)
-            except (OSError, IOError):
-                pass
+    def _stage_tmp(self, cache_path: Path, tmp_path: Optional[str] = None) -> None:
+        """Pick a staging file for a download and make sure it is removed with this File.
+
+        Names are derived from the cache path, so no mkstemp is needed, and a
+        finished staging file is renamed into the cache; there is nothing to pool.
+        ``tmp_path`` overrides the per-process location (a locked partial).
+        """
+        staging = _staging_dir(self.get_cache_dir(), os.getpid())
+        if tmp_path is None:
+            staging.mkdir(parents=True, exist_ok=True)
+            tmp_path = str(staging / f"{cache_path.parent.name}-{cache_path.name}.tmp")
+        self._tmp_path = tmp_path
+        self._finalizer = weakref.finalize(self, _safe_unlink, self._tmp_path)
+
+    def _commit_tmp(self, cache_path: Path) -> None:
+        """Move a finished download into the cache, replacing any stale copy."""
+        # Eviction elsewhere may have removed the hash dir since the download began
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(self._tmp_path, cache_path)
+        self._release_tmp()
+        self._path = str(cache_path)
 
-    def _populate_metadata(self) -> None:
-        if self._path and os.path.exists(self._path):
-            if not self.content_type:
-                self.content_type = self._guess_content_type()
-            if not self.size:
-                self.size = self._get_file_size()
-            if not self.filename:
-                self.filename = self._get_filename()
+    def _trim_cache(self, cache_path: Path) -> None:
+        """Apply FILE_CACHE_MAX_BYTES once a download is in place, never evicting it."""
+        max_bytes = _cache_max_bytes()
+        if max_bytes:
+            _evict_cache(self.get_cache_dir(), max_bytes, keep=cache_path)
+
+    def _discard_tmp(self) -> None:
+        if self._tmp_path:
+            _safe_unlink(self._tmp_path)
+        self._release_tmp()
+
+    def _release_tmp(self) -> None:
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
+        self._tmp_path = None
 
     def _guess_content_type(self) -> Optional[str]:
-        return mimetypes.guess_type(self._path)[0] if self._path else None
+        return _guess_type(self._path) if self._path else None
+
+    def _get_stat(self) -> os.stat_result:
+        """``os.stat`` of the local path, cached until ``refresh_metadata()`` or a new path."""
+        st = self._stat
+        if st is None:
+            st = self._stat = os.fstat(self._fd) if self._fd is not None else os.stat(self._path)
+        return st
 
     def _get_file_size(self) -> int:
-        return os.path.getsize(self._path) if self._path else 0
+        return self._get_stat().st_size if self._path else 0
 
     def _get_filename(self) -> str:
         return os.path.basename(self._path) if self._path else ""
+
+
+def _file_json_schema(_schema: CoreSchema, _handler: Any) -> dict:
+    return {"type": "string", "format": "file"}
+
+
+@functools.lru_cache(maxsize=None)
+def _file_core_schema(cls: type) -> CoreSchema:
+    return cls._build_core_schema()
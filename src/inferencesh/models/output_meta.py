@@ -4,8 +4,10 @@ Types and field names are kept in sync with Go source of truth
 (common-go/pkg/models/usage.go) via generated output_meta_gen.py.
 """
 
-from typing import Any, List, Optional
-from pydantic import BaseModel, Field
+from typing import Annotated, Any, List, Optional, Union
+from pydantic import BaseModel, Discriminator, Field, GetJsonSchemaHandler, Tag
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import CoreSchema
 
 # Import generated enums from Go source of truth
 from inferencesh.output_meta_gen import MetaItemType, VideoResolution
@@ -72,8 +74,55 @@ class RawMeta(MetaItem):
     cost: float = Field(default=0, description="Cost in dollar cents")
 
 
-# Union type for proper serialization of all MetaItem subclasses
-MetaItemUnion = TextMeta | ImageMeta | VideoMeta | AudioMeta | RawMeta
+# Union type for proper serialization of all MetaItem subclasses.
+_MetaItemVariants = Union[TextMeta, ImageMeta, VideoMeta, AudioMeta, RawMeta]
+
+_META_ITEM_CLASSES = {
+    MetaItemType.TEXT.value: TextMeta,
+    MetaItemType.IMAGE.value: ImageMeta,
+    MetaItemType.VIDEO.value: VideoMeta,
+    MetaItemType.AUDIO.value: AudioMeta,
+    MetaItemType.RAW.value: RawMeta,
+}
+_META_ITEM_TAGS = {cls: tag for tag, cls in _META_ITEM_CLASSES.items()}
+# Items without a known tag go through the plain union, as before tagging
+_UNTAGGED = "untagged"
+
+
+def _meta_item_tag(v: Any) -> str:
+    """Pick the variant for an item: by class for instances, by "type" for dicts."""
+    if isinstance(v, dict):
+        tag = v.get("type")
+        return tag if tag in _META_ITEM_CLASSES else _UNTAGGED
+    return _META_ITEM_TAGS.get(type(v), _UNTAGGED)
+
+
+class _UntaggedJsonSchema:
+    """Publish the plain union of the variants as the JSON schema.
+
+    The tagged union's own schema would be a oneOf that also lists the
+    catch-all branch, so every valid item would match two branches.
+    """
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema: CoreSchema, handler: GetJsonSchemaHandler) -> JsonSchemaValue:
+        return handler(schema["choices"][_UNTAGGED])
+
+
+# Known "type" values dispatch straight to the matching subclass instead of
+# trying each variant in turn; anything else keeps the smart-union behavior.
+MetaItemUnion = Annotated[
+    Union[
+        Annotated[TextMeta, Tag(MetaItemType.TEXT.value)],
+        Annotated[ImageMeta, Tag(MetaItemType.IMAGE.value)],
+        Annotated[VideoMeta, Tag(MetaItemType.VIDEO.value)],
+        Annotated[AudioMeta, Tag(MetaItemType.AUDIO.value)],
+        Annotated[RawMeta, Tag(MetaItemType.RAW.value)],
+        Annotated[_MetaItemVariants, Tag(_UNTAGGED)],
+    ],
+    Discriminator(_meta_item_tag),
+    _UntaggedJsonSchema,
+]
 
 
 class OutputMeta(BaseModel):
@@ -114,7 +114,8 @@ def patch_requests(monkeypatch):
             return fake_request(*args, **kwargs)
 
         def put(self, url, data=None, headers=None):
-            self.put_calls.append({"url": url, "size": len(data or b"")})
+            body = data.read() if hasattr(data, "read") else (data or b"")
+            self.put_calls.append({"url": url, "size": len(body)})
             return DummyResponse(status_code=200)
 
     fake_requests = FakeRequestsModule()
@@ -328,6 +329,26 @@ def test_upload_file_from_bytes(tmp_path, patch_requests):
     assert patch_requests.put_calls[0]["size"] == 7  # len(b"PNGDATA")
 
 
+def test_upload_file_from_buffer_without_copy(tmp_path, patch_requests, monkeypatch):
+    """bytearray/memoryview uploads should reach the PUT as a byte view, not a bytes copy."""
+    client = Inference(api_key="test")
+    bodies = []
+    original_put = patch_requests.put
+
+    def put(url, data=None, headers=None):
+        bodies.append(data)
+        return original_put(url, data=data, headers=headers)
+
+    monkeypatch.setattr(patch_requests, "put", put)
+
+    buf = bytearray(b"PNGDATA")
+    client.upload_file(buf)
+    client.upload_file(memoryview(buf)[3:])
+
+    assert [c["size"] for c in patch_requests.put_calls] == [7, 4]
+    assert all(isinstance(b, memoryview) and b.obj is buf for b in bodies)
+
+
 def test_upload_file_from_path(tmp_path, patch_requests):
     """Test upload_file() with file path."""
     file_path = tmp_path / "test.txt"
@@ -343,6 +364,25 @@ def test_upload_file_from_path(tmp_path, patch_requests):
     assert patch_requests.put_calls[0]["size"] == 11  # len(b"hello world")
 
 
+def test_upload_file_empty_path_sends_empty_body(tmp_path, patch_requests, monkeypatch):
+    """An empty file should be PUT as b"" (Content-Length: 0), not a chunked stream."""
+    file_path = tmp_path / "empty.txt"
+    file_path.write_bytes(b"")
+    client = Inference(api_key="test")
+    bodies = []
+    original_put = patch_requests.put
+
+    def put(url, data=None, headers=None):
+        bodies.append(data)
+        return original_put(url, data=data, headers=headers)
+
+    monkeypatch.setattr(patch_requests, "put", put)
+
+    client.upload_file(str(file_path))
+
+    assert bodies == [b""]
+
+
 def test_task_status_enum():
     """Test TaskStatus enum values."""
     assert TaskStatus.RECEIVED == 1
@@ -410,6 +450,10 @@ class MockClientSession:
     """Mock aiohttp.ClientSession."""
     def __init__(self, responses):
         self._responses = responses
+        self.closed = False
+    
+    async def close(self):
+        self.closed = True
     
     async def __aenter__(self):
         return self
@@ -556,6 +600,46 @@ async def test_async_run_stream(patch_aiohttp):
     assert final["status"] == TaskStatus.COMPLETED
 
 
+@pytest.mark.asyncio
+async def test_async_client_reuses_http_session(patch_aiohttp):
+    """Consecutive async calls share one pooled session until aclose()."""
+    created = []
+
+    def make_session(**kwargs):
+        created.append(MockClientSession({}))
+        return created[-1]
+
+    patch_aiohttp.ClientSession = make_session
+
+    async with AsyncInference(api_key="test") as client:
+        await client.get_task("task_async_123")
+        await client.get_task("task_async_123")
+        assert len(created) == 1
+
+    assert created[0].closed
+
+
+def test_async_client_closes_session_from_previous_loop(patch_aiohttp):
+    """A client shared across asyncio.run() calls closes the old loop's session."""
+    import asyncio
+
+    created = []
+
+    def make_session(**kwargs):
+        created.append(MockClientSession({}))
+        return created[-1]
+
+    patch_aiohttp.ClientSession = make_session
+    client = AsyncInference(api_key="test")
+
+    asyncio.run(client.get_task("task_async_123"))
+    asyncio.run(client.get_task("task_async_123"))
+
+    assert len(created) == 2
+    assert created[0].closed
+    assert not created[1].closed
+
+
 @pytest.mark.asyncio
 async def test_async_get_task(patch_aiohttp):
     """Test async get_task() returns current task state."""
@@ -726,3 +810,156 @@ async def test_async_tasks_cancel_via_namespace(patch_aiohttp):
 
     # Should not raise
     await client.tasks.cancel("task_async_123")
+
+
+# ==================== Sessions batch helpers ====================
+
+def test_sessions_keepalive_many(monkeypatch):
+    """keepalive_many() should hit each session and keep input order."""
+    client = Inference(api_key="test")
+    calls = []
+
+    def fake_request(method, endpoint, **kwargs):
+        calls.append((method, endpoint))
+        return {"id": endpoint.split("/")[2]}
+
+    monkeypatch.setattr(client, "_request", fake_request)
+
+    ids = [f"sess_{i}" for i in range(20)]
+    result = client.sessions.keepalive_many(ids)
+
+    assert [r["id"] for r in result] == ids
+    assert sorted(calls) == sorted(("post", f"/sessions/{i}/keepalive") for i in ids)
+
+
+@pytest.mark.asyncio
+async def test_async_sessions_end_many(monkeypatch):
+    """Async end_many() should end every session."""
+    client = AsyncInference(api_key="test")
+    calls = []
+
+    async def fake_request(method, endpoint, **kwargs):
+        calls.append((method, endpoint))
+
+    monkeypatch.setattr(client, "_request", fake_request)
+
+    await client.sessions.end_many(["sess_a", "sess_b", "sess_a"])
+
+    assert sorted(calls) == [("delete", "/sessions/sess_a"), ("delete", "/sessions/sess_b")]
+
+
+def test_sessions_get_many_dedupes(monkeypatch):
+    """get_many() should fetch each distinct session once and fan results back out."""
+    client = Inference(api_key="test")
+    calls = []
+
+    def fake_request(method, endpoint, **kwargs):
+        calls.append(endpoint)
+        return {"id": endpoint.split("/")[2]}
+
+    monkeypatch.setattr(client, "_request", fake_request)
+
+    result = client.sessions.get_many(["sess_a", "sess_b", "sess_a"])
+
+    assert [r["id"] for r in result] == ["sess_a", "sess_b", "sess_a"]
+    assert sorted(calls) == ["/sessions/sess_a", "/sessions/sess_b"]
+
+
+# ==================== Async concurrency cap ====================
+
+@pytest.mark.asyncio
+async def test_async_max_concurrent_calls(monkeypatch):
+    """_request() should never run more than max_concurrent_calls at once."""
+    import asyncio
+
+    client = AsyncInference(api_key="test", max_concurrent_calls=2)
+    in_flight = 0
+    peak = 0
+
+    async def fake_send(method, endpoint, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    monkeypatch.setattr(client, "_send_request", fake_send)
+
+    await asyncio.gather(*(client._request("get", f"/tasks/{i}") for i in range(8)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_async_priority_call_skips_shared_queue(monkeypatch):
+    """Priority session calls should not wait behind saturated regular calls."""
+    import asyncio
+    from inferencesh.api import AsyncSessionHandle
+
+    client = AsyncInference(api_key="test", max_concurrent_calls=4)
+    release = asyncio.Event()
+    in_flight = 0
+    peak = 0
+
+    async def fake_send(method, endpoint, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        if endpoint == "/slow":
+            await release.wait()
+        in_flight -= 1
+        return {"id": "task_1", "status": TaskStatus.COMPLETED, "output": {"ok": True}}
+
+    monkeypatch.setattr(client, "_send_request", fake_send)
+
+    slow = asyncio.gather(*(client._request("get", "/slow") for _ in range(8)))
+    await asyncio.sleep(0)
+
+    session = AsyncSessionHandle(client, "some/app", "sess_1")
+    result = await asyncio.wait_for(session.call("run", {}, priority=True, wait=False), timeout=1)
+
+    assert result["id"] == "task_1"
+    release.set()
+    await slow
+    # Priority slots come out of the limit, not on top of it
+    assert peak == 4
+
+
+@pytest.mark.asyncio
+async def test_async_session_end_is_single_flight(monkeypatch):
+    """Concurrent end() calls on one handle should issue a single DELETE."""
+    import asyncio
+    from inferencesh.api import AsyncSessionHandle
+
+    client = AsyncInference(api_key="test")
+    calls = []
+
+    async def fake_request(method, endpoint, **kwargs):
+        calls.append((method, endpoint))
+        await asyncio.sleep(0.01)
+
+    monkeypatch.setattr(client, "_request", fake_request)
+
+    handle = AsyncSessionHandle(client, "some/app", "sess_1")
+    await asyncio.gather(handle.end(), handle.end(), handle.__aexit__(None, None, None))
+
+    assert calls == [("delete", "/sessions/sess_1")]
+
+
+# ==================== JSON codec ====================
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_codec_roundtrip(monkeypatch, use_orjson):
+    """Request bodies encode and decode the same with or without orjson installed."""
+    from inferencesh import client as client_mod
+
+    if not use_orjson:
+        monkeypatch.setattr(client_mod, "_orjson", None)
+    elif client_mod._orjson is None:
+        pytest.skip("orjson not installed")
+
+    body = {"app": "some/app", "input": {"text": "héllo", "n": [1, 2.5, None, True]}}
+    assert client_mod._json_loads(client_mod._json_dumps(body)) == body
+    # Non-str keys are outside orjson's defaults; the stdlib fallback handles them
+    assert client_mod._json_loads(client_mod._json_dumps({1: "a"})) == {"1": "a"}
+    assert isinstance(client_mod._json_dumps_text(body), str)
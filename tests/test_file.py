@@ -4,7 +4,7 @@ import os
 import json
 import tempfile
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from pydantic import BaseModel, Field
 
 from inferencesh import File
@@ -64,6 +64,21 @@ class TestFileEagerLoading:
             data = file.to_dict()
             assert data["uri"] == url
 
+    def test_copy_of_resolved_file_skips_resolution(self):
+        """Copying a resolved File should reuse its path and metadata."""
+        url = "https://example.com/image.jpg"
+
+        with patch.object(File, '_download_url') as mock_download:
+            source = File(uri=url, path="/tmp/image.jpg", content_type="image/jpeg")
+            copy = File(source)
+
+            mock_download.assert_not_called()
+            assert copy is not source
+            assert copy.uri == url
+            assert copy.path == "/tmp/image.jpg"
+            assert copy.content_type == "image/jpeg"
+            assert copy.is_resolved() is True
+
     def test_data_uri_decodes_on_construction(self):
         """Data URIs should decode eagerly on construction."""
         data_uri = "data:text/plain;base64,SGVsbG8gV29ybGQ="
@@ -170,3 +185,369 @@ class TestFileJsonSchema:
             # Should have uri, not path (since not downloaded)
             assert data["image"]["uri"] == "https://example.com/image.jpg"
             assert data["image"].get("path") is None
+
+
+class TestFileCoreSchemaCache:
+    """Test that File's pydantic core schema is built once per class."""
+
+    def test_subclass_schema_built_once(self):
+        """Models using the same File subclass should share one built schema."""
+        from typing import List
+
+        class ImageFile(File):
+            pass
+
+        with patch.object(ImageFile, "_build_core_schema", wraps=ImageFile._build_core_schema) as build:
+            class First(BaseModel):
+                image: ImageFile
+
+            class Second(BaseModel):
+                images: List[ImageFile]
+
+        assert build.call_count == 1
+        assert isinstance(Second(images=[First(image=__file__).image]).images[0], ImageFile)
+
+    def test_json_schema_overrides_do_not_leak(self):
+        """Per-field schema overrides must not change other models' File fields."""
+        from pydantic import WithJsonSchema
+        from typing import Annotated
+
+        class Overridden(BaseModel):
+            n: Annotated[File, WithJsonSchema({"type": "integer"})]
+            d: Annotated[File, Field(description="doc", json_schema_extra={"x": 1})]
+
+        class Plain(BaseModel):
+            d: File
+
+        assert Overridden.model_json_schema()["properties"]["n"]["type"] == "integer"
+        assert Plain.model_json_schema()["properties"]["d"] == {"type": "string", "format": "file", "title": "D"}
+
+
+class TestFileGather:
+    """Test concurrent async construction of many Files."""
+
+    async def test_gather_resolves_in_order(self):
+        """gather() should return one File per initializer, in input order."""
+        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as f:
+            f.write(b"test")
+            path = f.name
+
+        url = "https://example.com/gather_never_cached.jpg"
+        try:
+            with patch.object(File, '_adownload_url', new_callable=AsyncMock) as mock_download, \
+                    patch.object(File, '_download_url') as mock_sync_download:
+                files = await File.gather([path, url, {"path": path}])
+
+                mock_download.assert_awaited_once()
+                mock_sync_download.assert_not_called()
+                assert [f.uri for f in files] == [path, url, None]
+                assert files[0].path == os.path.abspath(path)
+                assert files[2].path == os.path.abspath(path)
+        finally:
+            os.unlink(path)
+
+    def test_prefetch_all_sync_downloads_concurrently(self):
+        """prefetch_all_sync() should download every URL on the async path."""
+        urls = [f"https://example.com/prefetch_never_cached_{i}.jpg" for i in range(3)]
+        with patch.object(File, '_adownload_url', new_callable=AsyncMock) as mock_download, \
+                patch.object(File, '_download_url') as mock_sync_download:
+            files = File.prefetch_all_sync(urls, concurrency=2)
+
+        assert mock_download.await_count == 3
+        mock_sync_download.assert_not_called()
+        assert [f.uri for f in files] == urls
+
+
+class TestFileAsyncSession:
+    """Test the shared aiohttp session used for async downloads."""
+
+    def test_session_from_previous_loop_is_closed(self, monkeypatch):
+        """A new event loop replaces the download session and closes the old one."""
+        import asyncio
+        import sys
+        import types
+        from inferencesh.models import file as file_module
+
+        created = []
+
+        class FakeSession:
+            def __init__(self, **kwargs):
+                self.closed = False
+                created.append(self)
+
+            async def close(self):
+                self.closed = True
+
+        fake_aiohttp = types.SimpleNamespace(
+            ClientSession=FakeSession,
+            TCPConnector=lambda **kwargs: None,
+            ClientTimeout=lambda **kwargs: None,
+        )
+        monkeypatch.setitem(sys.modules, "aiohttp", fake_aiohttp)
+        monkeypatch.setattr(file_module, "_async_session", None)
+        monkeypatch.setattr(file_module, "_async_session_loop", None)
+
+        asyncio.run(file_module._get_async_session())
+        asyncio.run(file_module._get_async_session())
+
+        assert len(created) == 2
+        assert created[0].closed
+        assert not created[1].closed
+
+
+class TestFileCachePath:
+    """Test cache path derivation for URLs."""
+
+    def test_default_hash_is_stable(self, monkeypatch, tmp_path):
+        """Default cache keys must not change, so existing caches stay valid."""
+        import hashlib
+
+        monkeypatch.setenv("FILE_CACHE_DIR", str(tmp_path))
+        monkeypatch.delenv("FILE_CACHE_HASH_VERSION", raising=False)
+
+        path = File._get_cache_path("https://example.com/a/image.jpg?x=1")
+        expected = hashlib.sha256(b"example.com/a/image.jpg?x=1").hexdigest()[:12]
+        assert path == tmp_path / expected / "image.jpg"
+
+    def test_hash_version_opt_in(self, monkeypatch, tmp_path):
+        """FILE_CACHE_HASH_VERSION=2 should switch to a different key scheme."""
+        monkeypatch.setenv("FILE_CACHE_DIR", str(tmp_path))
+        url = "https://example.com/a/image.jpg"
+
+        monkeypatch.setenv("FILE_CACHE_HASH_VERSION", "1")
+        v1 = File._get_cache_path(url)
+        monkeypatch.setenv("FILE_CACHE_HASH_VERSION", "2")
+        v2 = File._get_cache_path(url)
+
+        assert v1 != v2
+        assert v2.name == "image.jpg"
+        assert len(v2.parent.name) == 12
+
+
+class TestFileTmpCleanup:
+    """Test that staged download files do not outlive their File."""
+
+    def test_staged_tmp_removed_with_file(self, monkeypatch, tmp_path):
+        """A staged .tmp file should be unlinked when the File is collected."""
+        from pathlib import Path
+
+        monkeypatch.setenv("FILE_CACHE_DIR", str(tmp_path))
+        local = tmp_path / "local.txt"
+        local.write_text("x")
+
+        file = File(path=str(local))
+        file._stage_tmp(Path(tmp_path) / "abc" / "image.jpg")
+        staged = file._tmp_path
+        open(staged, "wb").close()
+
+        assert os.path.dirname(staged).startswith(str(tmp_path / ".staging"))
+        del file
+        assert not os.path.exists(staged)
+
+    def test_staging_recreated_after_cache_dir_removed(self, monkeypatch, tmp_path):
+        """Clearing the cache dir mid-process must not break later downloads."""
+        import shutil
+        from pathlib import Path
+
+        monkeypatch.setenv("FILE_CACHE_DIR", str(tmp_path / "cache"))
+        local = tmp_path / "local.txt"
+        local.write_text("x")
+        file = File(path=str(local))
+
+        file._stage_tmp(Path(tmp_path) / "cache" / "abc" / "a.jpg")
+        shutil.rmtree(tmp_path / "cache")
+        file._stage_tmp(Path(tmp_path) / "cache" / "abc" / "b.jpg")
+
+        assert os.path.isdir(os.path.dirname(file._tmp_path))
+
+    def test_stale_staging_of_dead_process_reclaimed(self, monkeypatch, tmp_path):
+        """Partials left by a killed process are removed once they are old."""
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        proc = subprocess.Popen([sys.executable, "-c", "pass"])
+        proc.wait()
+        dead = tmp_path / ".staging" / str(proc.pid)
+        dead.mkdir(parents=True)
+        (dead / "abc-big.bin.tmp").write_bytes(b"partial")
+        for p in (dead / "abc-big.bin.tmp", dead):
+            os.utime(p, (0, 0))
+
+        monkeypatch.setenv("FILE_CACHE_DIR", str(tmp_path))
+        local = tmp_path / "local.txt"
+        local.write_text("x")
+        File(path=str(local))._stage_tmp(Path(tmp_path) / "abc" / "a.jpg")
+
+        assert not dead.exists()
+
+
+class TestFileValidateCache:
+    """Test the opt-in memo of resolved Files used during validation."""
+
+    def test_repeated_validation_resolves_once(self, monkeypatch):
+        """With FILE_VALIDATE_CACHE=1 the same input is resolved only once."""
+        class TestModel(BaseModel):
+            image: File
+
+        monkeypatch.setenv("FILE_VALIDATE_CACHE", "1")
+        url = "https://example.com/validate_cache.jpg"
+
+        def fake_download(self, *args, **kwargs):
+            self._path = "/tmp/validate_cache.jpg"
+
+        with patch.object(File, '_download_url', autospec=True, side_effect=fake_download) as mock_download:
+            first = TestModel(image=url).image
+            second = TestModel(image=url).image
+            third = TestModel(image={"uri": url}).image
+
+        mock_download.assert_called_once()
+        assert first is not second
+        assert first.uri == second.uri == third.uri == url
+        assert first.path == second.path == third.path == "/tmp/validate_cache.jpg"
+
+    def test_data_uris_not_memoized(self, monkeypatch):
+        """Inline data URIs bypass the memo so their payloads are not pinned."""
+        from inferencesh.models.file import _resolved_file
+
+        class TestModel(BaseModel):
+            image: File
+
+        monkeypatch.setenv("FILE_VALIDATE_CACHE", "1")
+        _resolved_file.cache_clear()
+        uri = "data:text/plain;base64,aGVsbG8="
+
+        TestModel(image=uri)
+        TestModel(image={"uri": uri})
+
+        assert _resolved_file.cache_info().currsize == 0
+
+
+class TestFileStatCache:
+    """Test that local metadata shares one cached stat until refreshed."""
+
+    def test_exists_and_size_stat_once(self, tmp_path):
+        """exists() and size should reuse a single os.stat call."""
+        local = tmp_path / "data.bin"
+        local.write_bytes(b"12345")
+        file = File(path=str(local))
+
+        with patch("inferencesh.models.file.os.stat", wraps=os.stat) as mock_stat:
+            assert file.exists()
+            assert file.size == 5
+            assert file.is_local()
+
+        assert mock_stat.call_count == 1
+
+    def test_refresh_metadata_clears_stat(self, tmp_path):
+        """refresh_metadata() should pick up changes made after the first stat."""
+        local = tmp_path / "data.bin"
+        local.write_bytes(b"12345")
+        file = File(path=str(local))
+        assert file.size == 5
+
+        local.write_bytes(b"1234567890")
+        with patch("inferencesh.models.file.os.stat", wraps=os.stat) as mock_stat:
+            file.refresh_metadata()
+            assert file.exists()
+
+        assert file.size == 10
+        assert mock_stat.call_count == 1
+
+    def test_from_open_file_uses_fstat(self, tmp_path):
+        """Files built from an open handle refresh via fstat and close their descriptor."""
+        local = tmp_path / "live.bin"
+        with open(local, "wb") as f:
+            f.write(b"12345")
+            f.flush()
+            file = File.from_open_file(f)
+            assert file.path == str(local)
+            assert file.size == 5
+
+            f.write(b"67890")
+            f.flush()
+            with patch("inferencesh.models.file.os.stat") as mock_stat:
+                file.refresh_metadata()
+            mock_stat.assert_not_called()
+            assert file.size == 10
+
+        fd = file._fd
+        del file
+        with pytest.raises(OSError):
+            os.fstat(fd)
+
+    def test_copies_do_not_share_descriptor(self, tmp_path):
+        """Copies and pickles of an open-file File stat by path, not the original's fd."""
+        import copy
+        import pickle
+
+        class Holder(BaseModel):
+            file: File
+
+        local = tmp_path / "live.bin"
+        local.write_bytes(b"12345")
+        with open(local, "rb") as f:
+            holder = Holder(file=File.from_open_file(f))
+
+        copies = [
+            holder.model_copy(deep=True).file,
+            copy.copy(holder.file),
+            pickle.loads(pickle.dumps(holder.file)),
+        ]
+        del holder
+        for dup in copies:
+            assert dup._fd is None
+            assert dup.path == str(local)
+            dup.refresh_metadata()
+            assert dup.size == 5
+
+
+class TestFileContentType:
+    """Test the per-extension content type memo."""
+
+    @pytest.mark.parametrize("name", ["a.png", "a.JPG", "a.tar.gz", "a.tgz", "noext"])
+    def test_matches_mimetypes(self, tmp_path, name):
+        """Memoized lookups should agree with mimetypes.guess_type, including compressed suffixes."""
+        import mimetypes
+
+        local = tmp_path / name
+        local.write_bytes(b"x")
+        assert File(path=str(local)).content_type == mimetypes.guess_type(str(local))[0]
+
+    def test_common_types_independent_of_registry(self, tmp_path):
+        """Common media extensions resolve even when the mimetypes registry lacks them."""
+        local = tmp_path / "frame.WEBP"
+        local.write_bytes(b"x")
+        with patch("inferencesh.models.file.mimetypes.guess_type", return_value=(None, None)):
+            assert File(path=str(local)).content_type == "image/webp"
+
+
+class TestFileDumpCache:
+    """Test that serialized File dicts are reused until metadata changes."""
+
+    def test_dump_reused_until_refresh(self, tmp_path):
+        """Repeated dumps return equal, independent dicts; refresh picks up changes."""
+        local = tmp_path / "data.txt"
+        local.write_bytes(b"12345")
+        file = File(path=str(local))
+
+        first = file.to_dict()
+        first["size"] = -1
+        assert file.to_dict()["size"] == 5
+
+        local.write_bytes(b"1234567890")
+        assert file.to_dict()["size"] == 5
+        file.refresh_metadata()
+        assert file.to_dict()["size"] == 10
+
+        file.uri = "renamed.txt"
+        assert file.to_dict()["uri"] == "renamed.txt"
+
+    def test_dump_not_cached_before_file_exists(self, tmp_path):
+        """An output File serialized before it is written picks up its size later."""
+        local = tmp_path / "out.txt"
+        file = File(path=str(local))
+
+        assert "size" not in file.to_dict()
+        local.write_bytes(b"1234567890")
+        assert file.to_dict()["size"] == 10
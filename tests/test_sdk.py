@@ -1,8 +1,32 @@
+import io
 import os
 import pytest
 import tempfile
 from inferencesh import BaseApp, BaseAppInput, BaseAppOutput, File
-import urllib.parse
+from inferencesh.models import file as file_module
+
+
+class MockSession:
+    """Stands in for the pooled requests.Session used by File downloads."""
+
+    def get(self, url, **kwargs):
+        class MockResponse:
+            status_code = 200
+            headers = {"content-length": "14"}
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                pass
+
+            def __init__(self):
+                self.raw = io.BytesIO(b"mocked content")
+
+            def raise_for_status(self):
+                pass
+
+        return MockResponse()
 
 def test_file_creation():
     # Create a temporary file
@@ -85,20 +109,7 @@ def test_file_validation():
 
 def test_file_from_url(monkeypatch):
     # Mock URL download
-    def mock_urlopen(request, **kwargs):
-        class MockResponse:
-            def __enter__(self):
-                return self
-
-            def __exit__(self, *args):
-                pass
-
-            def read(self):
-                return b"mocked content"
-
-        return MockResponse()
-    
-    monkeypatch.setattr(urllib.request, 'urlopen', mock_urlopen)
+    monkeypatch.setattr(file_module, "_get_http_session", MockSession)
     
     # Use a unique URL to avoid caching issues
     import time
@@ -138,31 +149,19 @@ def test_file_metadata_refresh():
     finally:
         os.unlink(path)
 
-def test_file_cleanup(monkeypatch):
+def test_file_cleanup(monkeypatch, tmp_path):
     # Mock URL download - same mock as test_file_from_url
-    def mock_urlopen(request, **kwargs):
-        class MockResponse:
-            def __enter__(self):
-                return self
-
-            def __exit__(self, *args):
-                pass
-
-            def read(self):
-                return b"mocked content"
+    monkeypatch.setattr(file_module, "_get_http_session", MockSession)
+    monkeypatch.setenv("FILE_CACHE_DIR", str(tmp_path))
 
-        return MockResponse()
-    
-    monkeypatch.setattr(urllib.request, 'urlopen', mock_urlopen)
-    
     url = "https://example.com/test.txt"
     file = File(uri=url)
-    
-    if file._tmp_path:
-        tmp_path = file._tmp_path
-        assert os.path.exists(tmp_path)
-        del file
-        assert not os.path.exists(tmp_path) 
+
+    # A committed download leaves nothing staged and no pending finalizer
+    assert file._tmp_path is None
+    assert file._finalizer is None
+    assert not list((tmp_path / ".staging").rglob("*.tmp"))
+    assert file.exists()
         
 def test_file_schema():
     """File fields should appear as {"type": "string", "format": "file"} inline, no $defs."""
@@ -188,6 +187,31 @@ def test_file_schema():
     assert images_schema["items"] == {"type": "string", "format": "file"}
 
 
+def test_app_schema_is_cached_per_class(monkeypatch):
+    """Repeated model_json_schema() calls reuse the first build and return independent copies."""
+    class TestInput(BaseAppInput):
+        prompt: str
+        image: File
+
+    calls = []
+    original = TestInput._get_field_order.__func__
+
+    def counting(cls):
+        calls.append(cls)
+        return original(cls)
+
+    monkeypatch.setattr(TestInput, "_get_field_order", classmethod(counting))
+
+    first = TestInput.model_json_schema()
+    first["properties"].clear()
+    second = TestInput.model_json_schema()
+
+    assert len(calls) == 1
+    assert list(second["properties"]) == ["prompt", "image"]
+    assert TestInput.model_json_schema(mode="serialization") is not None
+    assert len(calls) == 2
+
+
 def test_file_pydantic_validation():
     """File fields in pydantic models should accept strings, dicts, and File instances."""
     from typing import Optional
@@ -240,4 +264,314 @@ def test_file_pydantic_serialization():
         assert dumped["video"]["path"] == os.path.abspath(path)
         assert "content_type" in dumped["video"]
     finally:
-        os.unlink(path)
\ No newline at end of file
+        os.unlink(path)
+
+def test_file_bulk_download_dedupes(monkeypatch, tmp_path):
+    monkeypatch.setenv("FILE_CACHE_DIR", str(tmp_path))
+    calls = []
+
+    class CountingSession(MockSession):
+        def get(self, url, **kwargs):
+            calls.append(url)
+            return super().get(url, **kwargs)
+
+    monkeypatch.setattr(file_module, "_get_http_session", CountingSession)
+
+    import time
+    url = f"https://example.com/bulk_{int(time.time() * 1000)}.txt"
+    files = File.bulk_download([url] * 4, max_workers=4)
+
+    try:
+        assert len(calls) == 1
+        assert [f.uri for f in files] == [url] * 4
+        assert len({f.path for f in files}) == 1
+        assert all(f.exists() for f in files)
+    finally:
+        if files[0].path and os.path.exists(files[0].path):
+            os.unlink(files[0].path)
+
+
+class ScriptedSession:
+    """Session returning canned (status, headers, chunks) responses and recording request headers.
+
+    ``chunks`` is a list of byte strings returned by successive reads; an
+    exception in the list is raised when reached, simulating a dropped connection.
+    """
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def __call__(self):
+        return self
+
+    def get(self, url, headers=None, **kwargs):
+        self.requests.append(dict(headers or {}))
+        status, resp_headers, chunks = self.responses.pop(0)
+
+        class Raw:
+            decode_content = False
+
+            def __init__(self):
+                self._chunks = list(chunks)
+
+            def read(self, *args):
+                if not self._chunks:
+                    return b""
+                chunk = self._chunks.pop(0)
+                if isinstance(chunk, Exception):
+                    raise chunk
+                return chunk
+
+        class Response:
+            def __init__(self):
+                self.status_code = status
+                self.headers = resp_headers
+                self.raw = Raw()
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                pass
+
+            def raise_for_status(self):
+                if self.status_code >= 400:
+                    raise RuntimeError(f"HTTP {self.status_code}")
+
+        return Response()
+
+
+def test_file_revalidates_cache_with_etag(monkeypatch, tmp_path):
+    monkeypatch.setenv("FILE_CACHE_DIR", str(tmp_path))
+    url = "https://example.com/revalidate.txt"
+
+    session = ScriptedSession([
+        (200, {"content-length": "5", "etag": '"v1"'}, [b"hello"]),
+        (304, {}, []),
+    ])
+    monkeypatch.setattr(file_module, "_get_http_session", session)
+
+    first = File(uri=url)
+    monkeypatch.setenv("FILE_CACHE_REVALIDATE", "1")
+    second = File(uri=url)
+
+    assert session.requests[1]["If-None-Match"] == '"v1"'
+    assert second.path == first.path
+    with open(second.path, "rb") as f:
+        assert f.read() == b"hello"
+
+
+def test_file_download_resumes_with_range(monkeypatch, tmp_path):
+    import time
+
+    monkeypatch.setenv("FILE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(time, "sleep", lambda _s: None)
+    url = "https://example.com/resume.bin"
+
+    session = ScriptedSession([
+        (200, {"content-length": "10", "etag": '"v1"'}, [b"01234", ConnectionError("reset")]),
+        (206, {"content-length": "5", "etag": '"v1"'}, [b"56789"]),
+    ])
+    monkeypatch.setattr(file_module, "_get_http_session", session)
+
+    file = File(uri=url)
+
+    assert session.requests[1]["Range"] == "bytes=5-"
+    assert session.requests[1]["If-Range"] == '"v1"'
+    with open(file.path, "rb") as f:
+        assert f.read() == b"0123456789"
+
+
+def test_file_download_resumes_partial_left_by_crash(monkeypatch, tmp_path):
+    import json
+
+    monkeypatch.setenv("FILE_CACHE_DIR", str(tmp_path))
+    url = "https://example.com/crashed.bin"
+    cache_path = File._get_cache_path(url)
+
+    # A killed process leaves its partial, with preallocated zeros past the
+    # last recorded checkpoint, and no lock holder
+    partial = file_module._partial_path(tmp_path, cache_path)
+    with open(partial, "wb") as f:
+        f.write(b"01234" + b"\0" * 5)
+    with open(partial + ".json", "w") as f:
+        json.dump({"url": url, "validator": '"v1"', "written": 3}, f)
+
+    session = ScriptedSession([
+        (206, {"content-length": "7", "etag": '"v1"'}, [b"3456789"]),
+    ])
+    monkeypatch.setattr(file_module, "_get_http_session", session)
+
+    file = File(uri=url)
+
+    assert session.requests[0]["Range"] == "bytes=3-"
+    assert session.requests[0]["If-Range"] == '"v1"'
+    with open(file.path, "rb") as f:
+        assert f.read() == b"0123456789"
+    assert not os.path.exists(partial)
+    assert not os.path.exists(partial + ".json")
+
+
+def test_file_download_restarts_when_partial_is_rejected(monkeypatch, tmp_path):
+    import json
+
+    monkeypatch.setenv("FILE_CACHE_DIR", str(tmp_path))
+    url = "https://example.com/complete.bin"
+    partial = file_module._partial_path(tmp_path, File._get_cache_path(url))
+    with open(partial, "wb") as f:
+        f.write(b"0123456789")
+    with open(partial + ".json", "w") as f:
+        json.dump({"url": url, "validator": '"v1"', "written": 10}, f)
+
+    session = ScriptedSession([
+        (416, {}, []),
+        (200, {"content-length": "10", "etag": '"v1"'}, [b"0123456789"]),
+    ])
+    monkeypatch.setattr(file_module, "_get_http_session", session)
+
+    file = File(uri=url)
+
+    assert session.requests[0]["Range"] == "bytes=10-"
+    assert "Range" not in session.requests[1]
+    with open(file.path, "rb") as f:
+        assert f.read() == b"0123456789"
+    assert not os.path.exists(partial + ".json")
+
+
+def test_file_failed_download_keeps_resumable_partial(monkeypatch, tmp_path):
+    import time
+
+    monkeypatch.setenv("FILE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(time, "sleep", lambda _s: None)
+    url = "https://example.com/flaky.bin"
+
+    session = ScriptedSession([
+        (200, {"content-length": "10", "etag": '"v1"'}, [b"01234", ConnectionError("reset")]),
+        (503, {}, []),
+    ])
+    monkeypatch.setattr(file_module, "_get_http_session", session)
+    with pytest.raises(RuntimeError):
+        File(uri=url)
+
+    partial = file_module._partial_path(tmp_path, File._get_cache_path(url))
+    with open(partial, "rb") as f:
+        assert f.read() == b"01234"
+    assert file_module._read_partial(partial, url)["written"] == 5
+
+    # While another process holds the partial, downloads use private staging
+    fd = file_module._lock_file(partial + ".lock")
+    try:
+        session.responses.append((200, {"content-length": "10", "etag": '"v1"'}, [b"0123456789"]))
+        file = File(uri=url)
+        assert "Range" not in session.requests[-1]
+        with open(file.path, "rb") as f:
+            assert f.read() == b"0123456789"
+        assert os.path.exists(partial)
+    finally:
+        os.close(fd)
+
+
+def test_file_cache_ttl_and_size_cap(monkeypatch, tmp_path):
+    monkeypatch.setenv("FILE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("FILE_CACHE_MAX_BYTES", "8")
+
+    session = ScriptedSession([
+        (200, {"content-length": "5"}, [b"aaaaa"]),
+        (200, {"content-length": "5"}, [b"bbbbb"]),
+        (200, {"content-length": "5"}, [b"ccccc"]),
+    ])
+    monkeypatch.setattr(file_module, "_get_http_session", session)
+
+    first = File(uri="https://example.com/a.txt")
+    # Over the 8-byte cap: the older entry is evicted, the new download kept
+    second = File(uri="https://example.com/b.txt")
+    assert not os.path.exists(first.path)
+    assert os.path.exists(second.path)
+
+    # Within the TTL the cached copy is reused; once expired it is fetched again
+    monkeypatch.setenv("FILE_CACHE_TTL", "3600")
+    File(uri="https://example.com/b.txt")
+    assert len(session.requests) == 2
+    os.utime(second.path, (0, 0))
+    File(uri="https://example.com/b.txt")
+    assert len(session.requests) == 3
+
+
+def test_output_meta_item_dispatch():
+    from inferencesh.models.output_meta import AudioMeta, OutputMeta, TextMeta
+
+    # Known tags go straight to their subclass, even where fields overlap
+    meta = OutputMeta(outputs=[{"type": "audio", "seconds": 3}])
+    assert type(meta.outputs[0]) is AudioMeta
+
+    # Missing or unknown tags, and mismatched instances, validate as before
+    meta = OutputMeta(
+        inputs=[{"tokens": 5}, {"type": "custom", "tokens": 1}],
+        outputs=[TextMeta(type="image")],
+    )
+    assert [type(item) for item in meta.inputs] == [TextMeta, TextMeta]
+    assert meta.inputs[0].tokens == 5
+    assert meta.inputs[1].type == "custom"
+    assert type(meta.outputs[0]) is TextMeta
+
+    meta = OutputMeta(inputs=[TextMeta(tokens=150)], outputs=[AudioMeta(seconds=2)])
+    assert OutputMeta.model_validate_json(meta.model_dump_json()) == meta
+
+
+def test_output_meta_json_schema_is_plain_union():
+    from inferencesh.models.output_meta import OutputMeta
+
+    schema = OutputMeta.model_json_schema()
+    refs = [{"$ref": f"#/$defs/{name}"} for name in ("TextMeta", "ImageMeta", "VideoMeta", "AudioMeta", "RawMeta")]
+    # A oneOf including the catch-all branch would make every item match twice
+    for field in ("inputs", "outputs"):
+        assert schema["properties"][field]["items"] == {"anyOf": refs}
+
+
+def test_cache_eviction_errors_do_not_fail_download(monkeypatch, tmp_path):
+    monkeypatch.setenv("FILE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("FILE_CACHE_MAX_BYTES", "8")
+    session = ScriptedSession([
+        (200, {"content-length": "5"}, [b"aaaaa"]),
+        (200, {"content-length": "5"}, [b"bbbbb"]),
+    ])
+    monkeypatch.setattr(file_module, "_get_http_session", session)
+    File(uri="https://example.com/a.txt")
+
+    # Another process removing a hash dir mid-scan
+    real_scandir = os.scandir
+
+    def racing_scandir(path):
+        if os.path.dirname(str(path)) == str(tmp_path):
+            raise FileNotFoundError(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(file_module.os, "scandir", racing_scandir)
+    file = File(uri="https://example.com/b.txt")
+
+    assert len(session.requests) == 2
+    with open(file.path, "rb") as f:
+        assert f.read() == b"bbbbb"
+
+
+def test_file_download_survives_hash_dir_eviction(monkeypatch, tmp_path):
+    import shutil
+
+    monkeypatch.setenv("FILE_CACHE_DIR", str(tmp_path))
+    url = "https://example.com/evicted.txt"
+    cache_path = File._get_cache_path(url)
+
+    class EvictingSession(ScriptedSession):
+        def get(self, url, headers=None, **kwargs):
+            # Another process evicts the entry while this download is in flight
+            shutil.rmtree(cache_path.parent, ignore_errors=True)
+            return super().get(url, headers=headers, **kwargs)
+
+    session = EvictingSession([(200, {"content-length": "5"}, [b"hello"])])
+    monkeypatch.setattr(file_module, "_get_http_session", session)
+
+    file = File(uri=url)
+
+    with open(file.path, "rb") as f:
+        assert f.read() == b"hello"